@@ -2,105 +2,207 @@ import csv
 import json
 import re
 import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
 from urllib.parse import urlparse
 
+# Optional: orjson serializes several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def parse_additional_fields(row):
+# Below this row count, worker startup outweighs the parallel win
+_PARALLEL_MIN_ROWS = 2000
+
+# Rows per block when streaming serially
+_STREAM_CHUNK_ROWS = 1000
+
+
+@dataclass(slots=True)
+class FormRow:
+    """Fixed-layout per-row record: cheaper to allocate and smaller than a
+    dict with the same constant keys, and serialized natively by orjson"""
+    url_id: int
+    url: str
+    domain: str
+    has_captcha: bool
+    error: str
+    fields: dict
+    additional_fields: list
+
+
+def _dumps_record(record):
+    """Serialize one form entry to indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_INDENT_2)
+    return json.dumps(asdict(record), indent=2).encode('utf-8')
+
+
+def _write_json_stream(json_file, chunks):
+    """Write form entries as a JSON array chunk by chunk, so peak memory is
+    one chunk of records instead of the whole dataset plus its serialized
+    bytes. Returns the number of entries written."""
+    # Create directories if needed
+    os.makedirs(os.path.dirname(json_file) if os.path.dirname(json_file) else '.', exist_ok=True)
+
+    count = 0
+    with open(json_file, 'wb') as f:
+        f.write(b'[\n')
+        for chunk in chunks:
+            for record in chunk:
+                if count:
+                    f.write(b',\n')
+                f.write(_dumps_record(record))
+                count += 1
+        f.write(b'\n]')
+
+    return count
+
+
+def parse_additional_fields(row, additional_cols):
     """Parse additional fields from the CSV row into a structured list, including only required fields"""
     additional_fields = []
-    i = 1
-    
-    while True:
-        name_key = f"AdditionalField{i}Name"
-        type_key = f"AdditionalField{i}Type"
-        xpath_key = f"AdditionalField{i}XPath"
-        required_key = f"AdditionalField{i}Required"
-        
-        # Check if we've reached the end of additional fields
-        if name_key not in row or not row[name_key]:
+    row_len = len(row)
+
+    for name_i, type_i, xpath_i, required_i in additional_cols:
+        # Additional fields are written in order, so the first empty name
+        # marks the end for this row
+        name = row[name_i] if name_i < row_len else ''
+        if not name:
             break
-            
-        # Convert string 'True'/'False' to boolean
-        required = False
-        if required_key in row:
-            required = row[required_key] == "True"
-        
-        # Only include required additional fields
-        if required:
+
+        # Only include required additional fields (missing columns are -1)
+        if 0 <= required_i < row_len and row[required_i] == "True":
             additional_fields.append({
-                "name": row[name_key],
-                "type": row[type_key] if type_key in row and row[type_key] else "",
-                "xpath": row[xpath_key] if xpath_key in row and row[xpath_key] else "",
+                "name": name,
+                "type": row[type_i] if 0 <= type_i < row_len else "",
+                "xpath": row[xpath_i] if 0 <= xpath_i < row_len else "",
                 "required": True  # Always true since we're filtering for required fields
             })
-        
-        i += 1
-        
+
     return additional_fields
 
 
+def _process_rows_chunk(args):
+    """Assemble form entries for one block of CSV rows.
+
+    Top-level (and fed only picklable tuples/lists) so it can run in worker
+    processes; per-row work is independent, so chunks are embarrassingly
+    parallel.
+    """
+    start_id, rows, cols = args
+    url_i, domain_i, captcha_i, error_i, std_cols, additional_cols = cols
+    chunk = []
+
+    # URLs repeat across scrape CSVs and urlparse allocates several objects
+    # per call, so cache the netloc fallback per chunk
+    netloc_cache = {}
+
+    for index, row in enumerate(rows, start_id):
+        url = row[url_i]
+        domain = row[domain_i]
+        if not domain:
+            domain = netloc_cache.get(url)
+            if domain is None:
+                domain = urlparse(url).netloc
+                netloc_cache[url] = domain
+        row_len = len(row)
+
+        chunk.append(FormRow(
+            url_id=index,  # Unique identifier for each URL
+            url=url,
+            domain=domain,
+            has_captcha=captcha_i is not None and captcha_i < row_len
+                        and row[captcha_i].lower() == "true",
+            error=row[error_i] if error_i is not None and error_i < row_len else "",
+            # Only include fields that were found
+            fields={
+                field: {
+                    "type": row[type_i] if type_i is not None and type_i < row_len else "",
+                    "xpath": row[xpath_i],
+                    "required": required
+                }
+                for field, type_i, xpath_i, required in std_cols
+                if xpath_i < row_len and row[xpath_i]
+            },
+            additional_fields=parse_additional_fields(row, additional_cols)
+        ))
+
+    return chunk
+
+
 def convert_csv_to_json(csv_file, json_file):
     """Convert form fields CSV to a structured JSON format for automation"""
-    data = []
     standard_fields = [
-        "Title", "FirstName", "LastName", "Email", "ConfirmEmail", 
+        "Title", "FirstName", "LastName", "Email", "ConfirmEmail",
         "JobTitle", "Organization", "Phone", "Street", "City",
         "State", "Zipcode", "Country", "Privacy", "Submit"
     ]
-    
+
     with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        
-        for index, row in enumerate(reader, 1):
-            url = row['url']
-            domain = row['domain'] or urlparse(url).netloc
-            
-            form_data = {
-                "url_id": index,  # New unique identifier for each URL
-                "url": url,
-                "domain": domain,
-                "has_captcha": row.get("HasCaptcha", "").lower() == "true",
-                "error": row.get("error", ""),
-                "fields": {},
-                "additional_fields": parse_additional_fields(row)
-            }
-            
-            # Parse standard fields
-            for field in standard_fields:
-                type_key = f"{field}Type"
-                xpath_key = f"{field}XPath"
-                
-                # Only include fields that were found
-                if xpath_key in row and row[xpath_key]:
-                    form_data["fields"][field] = {
-                        "type": row[type_key] if type_key in row else "",
-                        "xpath": row[xpath_key],
-                        # Usually all fields are required except Privacy sometimes
-                        "required": field != "Privacy" if field != "ConfirmEmail" else False
-                    }
-            
-            data.append(form_data)
-    
-    # Create directories if needed
-    os.makedirs(os.path.dirname(json_file) if os.path.dirname(json_file) else '.', exist_ok=True)
-    
-    # Write the JSON with proper formatting
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
-    
-    return data
+        reader = csv.reader(f)
+        header = next(reader, [])
+
+        # Resolve every column to an integer index once; the row loop then
+        # does plain list indexing instead of building a dict per row the
+        # way DictReader does
+        idx = {c: i for i, c in enumerate(header)}
+        url_i = idx['url']
+        domain_i = idx['domain']
+        captcha_i = idx.get('HasCaptcha')
+        error_i = idx.get('error')
+
+        # Standard-field column indices plus the hoisted required-flag rule:
+        # usually true except Privacy sometimes (never ConfirmEmail)
+        std_cols = [(field, idx.get(f"{field}Type"), idx.get(f"{field}XPath"),
+                     field != "Privacy" if field != "ConfirmEmail" else False)
+                    for field in standard_fields]
+        std_cols = [(f, t, x, r) for f, t, x, r in std_cols if x is not None]
+
+        # Additional-field columns, bounded by what the header declares
+        max_additional = max((int(m.group(1)) for m in
+                              (re.match(r'AdditionalField(\d+)Name', c)
+                               for c in header) if m),
+                             default=0)
+        additional_cols = [(idx[f"AdditionalField{i}Name"],
+                            idx.get(f"AdditionalField{i}Type", -1),
+                            idx.get(f"AdditionalField{i}XPath", -1),
+                            idx.get(f"AdditionalField{i}Required", -1))
+                           for i in range(1, max_additional + 1)]
+
+        # Skip blank lines the way DictReader used to
+        rows = [row for row in reader if row]
+
+    cols = (url_i, domain_i, captcha_i, error_i, std_cols, additional_cols)
+
+    # Entries are streamed to disk as each chunk is assembled, so the full
+    # list of dicts is never held alongside its serialized bytes
+    if len(rows) < _PARALLEL_MIN_ROWS:
+        tasks = [(start + 1, rows[start:start + _STREAM_CHUNK_ROWS], cols)
+                 for start in range(0, len(rows), _STREAM_CHUNK_ROWS)]
+        return _write_json_stream(json_file, map(_process_rows_chunk, tasks))
+
+    # Fan the row blocks out to a process pool; ex.map preserves chunk
+    # order and each chunk numbers its own rows, so url_id stays stable
+    workers = os.cpu_count() or 1
+    size = -(-len(rows) // workers)
+    tasks = [(start + 1, rows[start:start + size], cols)
+             for start in range(0, len(rows), size)]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return _write_json_stream(json_file, ex.map(_process_rows_chunk, tasks))
 
 
 def main():
     # Hardcoded file paths
     csv_file = "form_fields_new.csv"
     json_file = "form_fields.json"
-    
+
     print(f"Converting {csv_file} to {json_file}...")
-    data = convert_csv_to_json(csv_file, json_file)
-    print(f"Conversion complete. Processed {len(data)} form entries.")
+    count = convert_csv_to_json(csv_file, json_file)
+    print(f"Conversion complete. Processed {count} form entries.")
     print(f"JSON output saved to: {json_file}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,285 +1,373 @@
 import re
+import functools
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException
 import logging
 
+# Optional: pyahocorasick gives a single linear scan over all field patterns
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: compiled literal-scan kernel (see field_map.pyx)
+try:
+    from field_map import map_field_literal
+except ImportError:
+    map_field_literal = None
+
 logger = logging.getLogger(__name__)
 
+# Translation table for cleaning attribute values; one C-level pass instead
+# of a regex substitution per attribute
+_CLEAN_TRANS = str.maketrans('-_', '  ')
+
+# Folds label punctuation noise (required markers, trailing colons, quotes)
+# to spaces so the final hint filter is a single C-level pass per hint
+_NOISE_TRANS = str.maketrans({c: ' ' for c in ':;*!?()[]{}"'})
+
+# Single JavaScript probe that gathers every hint guess_field_name needs in
+# one WebDriver round-trip: attributes, associated/parent labels, sibling
+# texts and address-container headers. Each execute_script call is a
+# JSON-over-HTTP hop, so one call replaces roughly a dozen.
+_JS_FIELD_HINTS = """
+var el = arguments[0];
+function txt(e) {
+    var t = e ? (e.innerText || e.textContent || '') : '';
+    return t.trim();
+}
+var out = {attrs: [], labelTexts: [], parentLabel: '',
+           prevTexts: [], nextTexts: [], addressHints: []};
+out.attrs = [el.name || '', el.id || '', el.placeholder || '',
+             el.getAttribute('aria-label') || '', el.title || '',
+             el.getAttribute('data-label') || ''];
+if (el.id) {
+    try {
+        var labels = document.querySelectorAll(
+            "label[for='" + el.id.replace(/'/g, "\\\\'") + "']");
+        for (var j = 0; j < labels.length; j++) {
+            out.labelTexts.push(txt(labels[j]));
+        }
+    } catch (e) {}
+}
+var parent = el.parentElement;
+if (parent && parent.tagName === 'LABEL') {
+    out.parentLabel = txt(parent);
+}
+var labelTags = ['LABEL', 'SPAN', 'DIV', 'P'];
+// Only the two nearest label-like preceding siblings carry the field's
+// label; anything further back belongs to other fields
+var prev = [];
+for (var s = el.previousElementSibling; s && prev.length < 2; s = s.previousElementSibling) {
+    if (labelTags.indexOf(s.tagName) !== -1) {
+        var t = txt(s);
+        if (t && t.length < 50) prev.push(t);
+    }
+}
+prev.reverse();  // document order, as the XPath axis returned them
+out.prevTexts = prev;
+var count = 0;
+for (var n = el.nextElementSibling; n && count < 2; n = n.nextElementSibling, count++) {
+    if (labelTags.indexOf(n.tagName) !== -1) {
+        var nt = txt(n);
+        if (nt && nt.length < 50) out.nextTexts.push(nt);
+    }
+}
+for (var a = el.parentElement; a; a = a.parentElement) {
+    var cls = (typeof a.className === 'string') ? a.className : '';
+    var isAddressDiv = a.tagName === 'DIV' &&
+        (cls.indexOf('address') !== -1 || cls.indexOf('shipping') !== -1 ||
+         cls.indexOf('billing') !== -1);
+    var legend = a.tagName === 'FIELDSET' ? a.querySelector('legend') : null;
+    var isAddressFieldset = legend && txt(legend).toLowerCase().indexOf('address') !== -1;
+    if (isAddressDiv || isAddressFieldset) {
+        out.addressHints.push('address field');
+        var headers = a.querySelectorAll('legend, h3, h4, label[class*="heading"]');
+        for (var h = 0; h < headers.length; h++) {
+            var ht = txt(headers[h]);
+            if (ht) out.addressHints.push(ht);
+        }
+        break;
+    }
+}
+return out;
+"""
+
+# Standard fields we're looking for, in CSV column order
+STANDARD_FIELDS = (
+    "Title", "FirstName", "LastName", "Email", "ConfirmEmail",
+    "JobTitle", "Organization", "Phone", "Street", "City",
+    "State", "Zipcode", "Country", "Privacy", "Submit"
+)
+
+# Priority fields that must be returned if possible
+PRIORITY_FIELDS = frozenset(("FirstName", "LastName", "Email"))
+
+# Patterns to match field names to standard fields. Module-level so the
+# cached mapping function below can use them without going through self,
+# and shared by every FieldDetector instance.
+_FIELD_PATTERNS = {
+    "Title": ("title", "prefix", "salutation", "honorific", "mr", "mrs", "ms", "dr", "prof", "suffix"),
+
+    "FirstName": ("first name", "firstname", "given name", "forename", "first", "fname", "givenname",
+                 "name.*first", "first.*name", "given", "name_first"),
+
+    "LastName": ("last name", "lastname", "surname", "family name", "last", "lname", "familyname",
+                "name.*last", "last.*name", "family", "name_last", "sur name"),
+
+    "Email": ("email", "e-mail", "mail", "emailaddress", "e mail", "your email", "primary email",
+             "contact email", "email.*address", "address.*email"),
+
+    "ConfirmEmail": ("confirm email", "repeat email", "verify email", "email confirm", "reenter email",
+                    "confirm.*email", "email.*confirm", "email.*again", "retype.*email", "verify.*email"),
+
+    "JobTitle": ("job title", "position", "role", "job role", "job position", "occupation", "title", "jobtitle",
+                 "job_title", "job-title", "job function", "profession", "work title"),
+
+    "Organization": ("company", "organization", "organisation", "employer", "business", "firm", "workplace",
+                    "company name", "employer name", "business name", "organization name", "institution", "Company Type"
+                    "corporation", "agency", "department", "employer info"),
+
+    "Phone": ("phone", "telephone", "mobile", "cell", "contact number", "phonenumber", "tel",
+              "phone.*number", "mobile.*number", "contact.*phone", "daytime phone", "evening phone",
+              "cell.*number", "primary phone", "work phone", "home phone"),
+
+    "Street": ("street", "address", "address line", "street address", "road", "addressline1", "address1",
+              "addr1", "address line 1", "street name", "house number", "building", "apartment",
+              "street.*address", "address.*line.*1", "addr.*line1", "address.*street", "shipping address",
+              "billing address", "mailing address", "delivery address", "residence", "location"),
+
+    "City": ("city", "town", "locality", "municipality", "urban area", "township", "city/town",
+             "city name", "place", "village", "borough", "location.*city", "city.*location", "address.*city"),
+
+    "State": ("state", "province", "region", "county", "territory", "division", "district",
+              "state/province", "administrative area", "location.*state", "state.*region",
+              "region.*state", "area"),
+
+    "Zipcode": ("zip", "zipcode", "postal code", "post code", "zip code", "postalcode", "postcode",
+                "postal", "pin code", "pin", "code postal", "zipcode.*postal", "postal.*zip",
+                "zip.*code", "postal.*code", "area code"),
+
+    "Country": ("country", "nation", "land", "territory", "nationality", "national", "country name",
+                "country/region", "region/country", "location.*country", "country.*location"),
+
+    "Privacy": ("privacy", "terms", "consent", "agree", "accept", "policy", "opt in", "gdpr", "marketing",
+                "permission", "subscribe", "newsletter", "communications", "contact me", "contact you",
+                "send me", "send you", "preference", "privacy.*policy", "terms.*conditions",
+                "terms.*service", "cookie", "data policy", "personal data", "personal information",
+                "data.*collect", "process.*data", "agreement", "updates", "notifications", "legal")
+}
+
+# Order each field's patterns longest-first so scans favor the most
+# specific (and for alternations, leftmost) pattern before short generic
+# ones like "first" or "mail"
+_FIELD_PATTERNS = {field: tuple(sorted(patterns, key=len, reverse=True))
+                   for field, patterns in _FIELD_PATTERNS.items()}
+
+# Split each field's patterns into plain literals and the '.*' wildcard
+# entries. Literals only ever need a substring scan; the wildcard entries
+# compile (unescaped, once) into a real regex per field, where before they
+# were escaped along with everything else and could never match.
+_LITERAL_PATTERNS = {
+    field: tuple(p for p in patterns if '.*' not in p)
+    for field, patterns in _FIELD_PATTERNS.items()
+}
+_REGEX_PATTERNS = {
+    field: re.compile('|'.join(p for p in patterns if '.*' in p))
+    for field, patterns in _FIELD_PATTERNS.items()
+    if any('.*' in p for p in patterns)
+}
+
+# Precompile one combined alternation regex per standard field so the hot
+# mapping path does a single C-level scan instead of recompiling a regex per
+# pattern per call. The old word-boundary check was a subset of the plain
+# substring check, so escaped alternation keeps the same matches.
+_COMPILED_PATTERNS = {
+    field: re.compile('|'.join(re.escape(p) for p in patterns))
+    for field, patterns in _LITERAL_PATTERNS.items()
+}
+
+# Precompiled matchers for the other per-call term scans
+_PRIVACY_INDICATORS_RE = re.compile(
+    '|'.join(re.escape(t) for t in [
+        "i agree", "agree to", "accept", "consent",
+        "subscribe", "sign up", "opt in", "permission",
+        "can contact", "may contact", "receive"
+    ]))
+_SUBMIT_TERMS_RE = re.compile(
+    '|'.join(re.escape(t) for t in ["submit", "send", "continue", "next", "go", "register"]))
+_ADDRESS_TYPE_RES = {
+    field: re.compile('|'.join(re.escape(i) for i in indicators))
+    for field, indicators in {
+        "Street": ["address line", "street address", "address1", "billing address", "shipping address"],
+        "City": ["city", "town"],
+        "State": ["state", "province", "region"],
+        "Zipcode": ["zip", "postal", "post code"],
+        "Country": ["country", "nation"]
+    }.items()
+}
+
+
+def _build_automaton():
+    """Build an Aho-Corasick automaton over all literal patterns so one scan
+    of the guessed name matches every field at once. Each word carries
+    (rank, field) where rank preserves the dict order the old loop used, so
+    ambiguous names still resolve to the same field."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for rank, (field, patterns) in enumerate(_LITERAL_PATTERNS.items()):
+        for pattern in patterns:
+            if not automaton.exists(pattern):
+                automaton.add_word(pattern, (rank, field))
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton()
+
+
+@functools.lru_cache(maxsize=8192)
+def _map_field(guessed_name, element_type):
+    """Cached mapping of (guessed_name, element_type) to a standard field.
+    The same label strings recur across thousands of pages, so repeat
+    lookups become a dict hit. Safe process-wide: the pattern tables above
+    are static."""
+    try:
+        guessed_name = guessed_name.lower()
+
+        # Dispatch on element_type first: for typed inputs the type alone
+        # almost always decides, so resolve that branch before paying for
+        # any string scanning
+        if element_type == 'email':
+            # If it's the second email field on the page, it's likely confirmation
+            if "confirm" in guessed_name or "verify" in guessed_name or "repeat" in guessed_name:
+                return "ConfirmEmail"
+            return "Email"
+
+        if element_type == 'tel':
+            return "Phone"
+
+        if element_type in ('submit', 'button'):
+            if _SUBMIT_TERMS_RE.search(guessed_name):
+                return "Submit"
+
+        elif element_type in ('checkbox', 'radio'):
+            # Enhanced privacy checkbox detection, including common consent patterns
+            if _COMPILED_PATTERNS["Privacy"].search(guessed_name):
+                return "Privacy"
+            if _PRIVACY_INDICATORS_RE.search(guessed_name):
+                return "Privacy"
+
+        # Check each address type with more specific patterns before the
+        # generic field scan
+        for field, indicator_re in _ADDRESS_TYPE_RES.items():
+            if indicator_re.search(guessed_name):
+                return field
+
+        # Check the standard field patterns: a single automaton scan when
+        # pyahocorasick is installed, then the Cython kernel if built,
+        # otherwise the precompiled matchers
+        if _AUTOMATON is not None:
+            best = min((value for _, value in _AUTOMATON.iter(guessed_name)),
+                       default=None)
+            if best is not None:
+                return best[1]
+        elif map_field_literal is not None:
+            match = map_field_literal(guessed_name, _LITERAL_PATTERNS)
+            if match is not None:
+                return match
+        else:
+            for std_field, pattern_re in _COMPILED_PATTERNS.items():
+                if pattern_re.search(guessed_name):
+                    return std_field
+
+        # Only the wildcard patterns need the regex engine, and only when
+        # no literal matched
+        for std_field, pattern_re in _REGEX_PATTERNS.items():
+            if pattern_re.search(guessed_name):
+                return std_field
+
+        # NEW: Handle address fields with common name/id patterns
+        address_patterns = {
+            "Street": ["addr", "address1", "line1", "street", "thoroughfare"],
+            "City": ["city", "town", "locality"],
+            "State": ["state", "province", "region", "territory"],
+            "Zipcode": ["zip", "postal", "postcode", "postalcode"],
+            "Country": ["country", "nation", "countries"]
+        }
+
+        for field, patterns in address_patterns.items():
+            for pattern in patterns:
+                if pattern in guessed_name:
+                    return field
+
+    except Exception as e:
+        logger.debug(f"Error in map_to_standard_field: {str(e)}")
+
+    # Return None if no match found
+    return None
+
+
 class FieldDetector:
     def __init__(self):
-        # Define standard fields we're looking for
-        self.standard_fields = [
-            "Title", "FirstName", "LastName", "Email", "ConfirmEmail", 
-            "JobTitle", "Organization", "Phone", "Street", "City",
-            "State", "Zipcode", "Country", "Privacy", "Submit"
-        ]
-        
-        # Priority fields that must be returned if possible
-        self.priority_fields = ["FirstName", "LastName", "Email"]
-        
-        # Define patterns to match field names to standard fields
-        self.field_patterns = {
-            "Title": ["title", "prefix", "salutation", "honorific", "mr", "mrs", "ms", "dr", "prof", "suffix"],
-            
-            "FirstName": ["first name", "firstname", "given name", "forename", "first", "fname", "givenname", 
-                         "name.*first", "first.*name", "given", "name_first"],
-            
-            "LastName": ["last name", "lastname", "surname", "family name", "last", "lname", "familyname", 
-                        "name.*last", "last.*name", "family", "name_last", "sur name"],
-            
-            "Email": ["email", "e-mail", "mail", "emailaddress", "e mail", "your email", "primary email", 
-                     "contact email", "email.*address", "address.*email"],
-            
-            "ConfirmEmail": ["confirm email", "repeat email", "verify email", "email confirm", "reenter email", 
-                            "confirm.*email", "email.*confirm", "email.*again", "retype.*email", "verify.*email"],
-            
-            "JobTitle": ["job title", "position", "role", "job role", "job position", "occupation", "title", "jobtitle", 
-                         "job_title", "job-title", "job function", "profession", "work title"],
-            
-            "Organization": ["company", "organization", "organisation", "employer", "business", "firm", "workplace", 
-                            "company name", "employer name", "business name", "organization name", "institution", "Company Type" 
-                            "corporation", "agency", "department", "employer info"],
-            
-            "Phone": ["phone", "telephone", "mobile", "cell", "contact number", "phonenumber", "tel", 
-                      "phone.*number", "mobile.*number", "contact.*phone", "daytime phone", "evening phone", 
-                      "cell.*number", "primary phone", "work phone", "home phone"],
-            
-            "Street": ["street", "address", "address line", "street address", "road", "addressline1", "address1", 
-                      "addr1", "address line 1", "street name", "house number", "building", "apartment", 
-                      "street.*address", "address.*line.*1", "addr.*line1", "address.*street", "shipping address", 
-                      "billing address", "mailing address", "delivery address", "residence", "location"],
-            
-            "City": ["city", "town", "locality", "municipality", "urban area", "township", "city/town", 
-                     "city name", "place", "village", "borough", "location.*city", "city.*location", "address.*city"],
-            
-            "State": ["state", "province", "region", "county", "territory", "division", "district", 
-                      "state/province", "administrative area", "location.*state", "state.*region", 
-                      "region.*state", "area"],
-            
-            "Zipcode": ["zip", "zipcode", "postal code", "post code", "zip code", "postalcode", "postcode", 
-                        "postal", "pin code", "pin", "code postal", "zipcode.*postal", "postal.*zip", 
-                        "zip.*code", "postal.*code", "area code"],
-            
-            "Country": ["country", "nation", "land", "territory", "nationality", "national", "country name", 
-                        "country/region", "region/country", "location.*country", "country.*location"],
-            
-            "Privacy": ["privacy", "terms", "consent", "agree", "accept", "policy", "opt in", "gdpr", "marketing", 
-                        "permission", "subscribe", "newsletter", "communications", "contact me", "contact you", 
-                        "send me", "send you", "preference", "privacy.*policy", "terms.*conditions", 
-                        "terms.*service", "cookie", "data policy", "personal data", "personal information", 
-                        "data.*collect", "process.*data", "agreement", "updates", "notifications", "legal"]
-        }
-    
+        # Shared module-level tables; no per-instance reallocation
+        self.standard_fields = STANDARD_FIELDS
+        self.priority_fields = PRIORITY_FIELDS
+        self.field_patterns = _FIELD_PATTERNS
+
     def guess_field_name(self, element, driver):
         """Try to determine what the field is for based on attributes and nearby text - with error handling"""
         field_hints = []
-        
-        # Check various attributes for clues
-        for attr in ['name', 'id', 'placeholder', 'aria-label', 'title', 'data-label']:
-            try:
-                value = element.get_attribute(attr)
-                if value:
-                    # Clean up the value to make it more readable
-                    value = re.sub(r'[-_]', ' ', value).strip().lower()
-                    if value and len(value) > 1:  # Skip single character or empty values
-                        field_hints.append(value)
-            except Exception as e:
-                logger.debug(f"Error getting attribute {attr}: {str(e)}")
-        
-        # Check for associated label by for attribute
-        try:
-            label_id = element.get_attribute('id')
-            if label_id:
-                try:
-                    labels = driver.find_elements(By.CSS_SELECTOR, f"label[for='{label_id}']")
-                    for label in labels:
-                        try:
-                            field_hints.append(label.text.strip().lower())
-                        except:
-                            pass
-                except:
-                    pass
-        except:
-            pass
-        
-        # Check for parent label
+
+        # One JS round-trip gathers every hint; assembly stays in Python
         try:
-            parent = element.find_element(By.XPATH, "./..")
-            if parent.tag_name == 'label':
-                field_hints.append(parent.text.strip().lower())
-        except (NoSuchElementException, StaleElementReferenceException):
-            pass
+            hints = driver.execute_script(_JS_FIELD_HINTS, element)
         except Exception as e:
-            logger.debug(f"Error checking parent label: {str(e)}")
-        
-        # Look for preceding siblings with label-like content
-        try:
-            prev_elements = element.find_elements(By.XPATH, "./preceding-sibling::*")
-            for prev in prev_elements:
-                try:
-                    if prev.tag_name in ['label', 'span', 'div', 'p']:
-                        text = prev.text.strip().lower()
-                        if text and len(text) < 50:  # Only consider short texts
-                            field_hints.append(text)
-                except (StaleElementReferenceException, AttributeError):
-                    continue
-                except Exception as e:
-                    logger.debug(f"Error checking preceding siblings: {str(e)}")
-        except:
-            pass
-        
-        # NEW: Check for common address field container classes
-        try:
-            address_containers = [
-                ".//ancestor::div[contains(@class, 'address')]",
-                ".//ancestor::div[contains(@class, 'shipping')]",
-                ".//ancestor::div[contains(@class, 'billing')]",
-                ".//ancestor::fieldset[contains(.//legend, 'address')]"
-            ]
-            
-            for xpath in address_containers:
-                try:
-                    container = element.find_element(By.XPATH, xpath)
-                    if container:
-                        # Try to get field section name if it's an address field
-                        section_hints = []
-                        try:
-                            # Check if there are hints in legends or section headers
-                            headers = container.find_elements(By.XPATH, ".//legend | .//h3 | .//h4 | .//label[contains(@class, 'heading')]")
-                            for header in headers:
-                                if header.text.strip():
-                                    section_hints.append(header.text.strip().lower())
-                        except:
-                            pass
-                        
-                        # Add address hint if we found a container
-                        field_hints.append("address field")
-                        if section_hints:
-                            field_hints.extend(section_hints)
-                        break
-                except:
-                    continue
-        except:
-            pass
-        
-        # NEW: Check for label text after the element (for address fields sometimes)
-        try:
-            next_elements = element.find_elements(By.XPATH, "./following-sibling::*")
-            for next_elem in next_elements[:2]:  # Only check the next 2 elements
-                try:
-                    if next_elem.tag_name in ['label', 'span', 'div', 'p']:
-                        text = next_elem.text.strip().lower()
-                        if text and len(text) < 50:
-                            field_hints.append(text)
-                except:
-                    continue
-        except:
-            pass
-        
-        # Filter out empty strings and duplicates
-        field_hints = [h for h in field_hints if h and not h.isspace()]
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        field_hints = [h for h in field_hints if not (h in seen or seen.add(h))]
-        
+            logger.debug(f"Error gathering field hints: {str(e)}")
+            return "Unknown Field"
+
+        # Attribute values, cleaned up to make them more readable
+        for value in hints.get('attrs', []):
+            if value:
+                value = value.translate(_CLEAN_TRANS).strip().lower()
+                if value and len(value) > 1:  # Skip single character or empty values
+                    field_hints.append(value)
+
+        # Associated labels (by for attribute)
+        for text in hints.get('labelTexts', []):
+            field_hints.append(text.strip().lower())
+
+        # Parent label
+        if hints.get('parentLabel'):
+            field_hints.append(hints['parentLabel'].strip().lower())
+
+        # Preceding siblings with label-like content
+        for text in hints.get('prevTexts', []):
+            field_hints.append(text.strip().lower())
+
+        # Address container hints ("address field" marker + section headers)
+        for text in hints.get('addressHints', []):
+            field_hints.append(text.strip().lower())
+
+        # Label text after the element (for address fields sometimes)
+        for text in hints.get('nextTexts', []):
+            field_hints.append(text.strip().lower())
+
+        # Fold punctuation noise, trim and length-bound every hint, then
+        # dedupe preserving order, all in one pass consumed by dict.fromkeys
+        field_hints = list(dict.fromkeys(
+            h for h in (hint.translate(_NOISE_TRANS).strip() for hint in field_hints)
+            if h and len(h) < 50))
+
         # Join all hints
         if field_hints:
             return " ".join(field_hints)
-        
+
         return "Unknown Field"
-    
+
     def map_to_standard_field(self, guessed_name, element_type):
         """Map a guessed field name to one of our standard field names - with error handling"""
         if not guessed_name:
             return None
-            
-        try:
-            guessed_name = guessed_name.lower()
-            
-            # Enhanced privacy checkbox detection
-            if element_type in ['checkbox', 'radio']:
-                privacy_patterns = self.field_patterns["Privacy"]
-                
-                # Special enhanced check for address type fields
-                for pattern in privacy_patterns:
-                    if pattern in guessed_name:
-                        return "Privacy"
-                        
-                # Additional checks for common privacy consent patterns
-                privacy_indicators = [
-                    "i agree", "agree to", "accept", "consent", 
-                    "subscribe", "sign up", "opt in", "permission",
-                    "can contact", "may contact", "receive"
-                ]
-                
-                for indicator in privacy_indicators:
-                    if indicator in guessed_name:
-                        return "Privacy"
-            
-            # Enhanced address field detection
-            address_type_indicators = {
-                "Street": ["address line", "street address", "address1", "billing address", "shipping address"],
-                "City": ["city", "town"],
-                "State": ["state", "province", "region"],
-                "Zipcode": ["zip", "postal", "post code"],
-                "Country": ["country", "nation"]
-            }
-            
-            # Check each address type first with more specific patterns
-            for field, indicators in address_type_indicators.items():
-                for indicator in indicators:
-                    if indicator in guessed_name:
-                        return field
-            
-            # Check input type for email fields
-            if element_type == 'email':
-                # If it's the second email field on the page, it's likely confirmation
-                if "confirm" in guessed_name or "verify" in guessed_name or "repeat" in guessed_name:
-                    return "ConfirmEmail"
-                return "Email"
-                
-            # Check input type for tel fields
-            if element_type == 'tel':
-                return "Phone"
-                
-            # Check for submit buttons
-            if element_type in ['submit', 'button']:
-                button_text = guessed_name.lower()
-                if any(term in button_text for term in ["submit", "send", "continue", "next", "go", "register"]):
-                    return "Submit"
-            
-            # Check each standard field pattern
-            for std_field, patterns in self.field_patterns.items():
-                for pattern in patterns:
-                    try:
-                        # Use regex to catch partial and word boundary matches
-                        if re.search(r'\b' + re.escape(pattern) + r'\b', guessed_name):
-                            return std_field
-                        if pattern in guessed_name:
-                            return std_field
-                    except re.error:
-                        # Handle regex errors
-                        logger.debug(f"Regex error with pattern {pattern}")
-                        if pattern in guessed_name:
-                            return std_field
-        
-            # NEW: Handle address fields with common name/id patterns
-            address_patterns = {
-                "Street": ["addr", "address1", "line1", "street", "thoroughfare"],
-                "City": ["city", "town", "locality"],
-                "State": ["state", "province", "region", "territory"],
-                "Zipcode": ["zip", "postal", "postcode", "postalcode"],
-                "Country": ["country", "nation", "countries"]
-            }
-            
-            for field, patterns in address_patterns.items():
-                for pattern in patterns:
-                    if pattern in guessed_name:
-                        return field
-                        
-        except Exception as e:
-            logger.debug(f"Error in map_to_standard_field: {str(e)}")
-                    
-        # Return None if no match found
-        return None
\ No newline at end of file
+        return _map_field(guessed_name, element_type)
@@ -0,0 +1,20 @@
+# cython: language_level=3
+"""Cython kernel for the literal field-pattern scan.
+
+Compiles the inner loop of the field mapping to C so the substring checks
+run without Python bytecode dispatch. Optional: field_detector falls back
+to its pure-Python scan when this extension is not built.
+
+Build in place with:
+    python setup_field_map.py build_ext --inplace
+"""
+
+
+def map_field_literal(str guessed_name, dict field_patterns):
+    """Return the first field whose literal patterns match guessed_name"""
+    cdef str field, pattern
+    for field, patterns in field_patterns.items():
+        for pattern in patterns:
+            if pattern in guessed_name:
+                return field
+    return None
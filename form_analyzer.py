@@ -4,12 +4,494 @@ import logging
 import re
 import time
 
+# Optional: pyahocorasick turns per-pattern scans into one linear pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+
+def _automaton_hits(automaton, value, field_name):
+    """Scan value once and report (substring_hit, word_boundary_hit) for the
+    given field; boundary verification happens on the match offsets"""
+    sub_hit = word_hit = False
+    last = len(value) - 1
+    for end, (plen, fields) in automaton.iter(value):
+        if field_name not in fields:
+            continue
+        sub_hit = True
+        start = end - plen + 1
+        before = value[start - 1] if start > 0 else ' '
+        after = value[end + 1] if end < last else ' '
+        if (not before.isalnum() and before != '_' and
+                not after.isalnum() and after != '_'):
+            word_hit = True
+            break
+    return sub_hit, word_hit
+
+# CAPTCHA selector groups, pre-joined so each group costs one in-page
+# querySelector call instead of a WebDriver round-trip per selector.
+# The reCAPTCHA/hCAPTCHA widgets themselves are caught by the cheaper
+# page-source markers in has_captcha and need no selector group.
+_IMAGE_CAPTCHA_SELECTOR = ", ".join([
+    "img[src*='captcha']",
+    "img[alt*='captcha']",
+    "img[id*='captcha']",
+    "img[class*='captcha']",
+    "div[id*='captcha'] img"
+])
+_CAPTCHA_INPUT_SELECTOR = ", ".join([
+    "input[name*='captcha']",
+    "input[id*='captcha']",
+    "#captcha",
+    ".captcha input"
+])
+_CAPTCHA_SCRIPT_SELECTOR = ", ".join([
+    "script[src*='recaptcha']",
+    "script[src*='hcaptcha']",
+    "script[src*='captcha']",
+    "script[src*='turnstile']"
+])
+
+# Scores every form in-page in one pass: visible input count, common field
+# names and submit button presence, mirroring the old per-form Python loop
+# that cost several round-trips per form
+_JS_SCORE_FORMS = """
+var common = ['email', 'name', 'first', 'last', 'phone', 'address'];
+function isVisible(e) {
+    var s = getComputedStyle(e);
+    var r = e.getBoundingClientRect();
+    return e.offsetParent !== null && r.width > 0 && r.height > 0 &&
+           s.visibility !== 'hidden' && s.display !== 'none';
+}
+var results = [];
+for (var i = 0; i < document.forms.length; i++) {
+    var form = document.forms[i];
+    var inputs = form.querySelectorAll('input:not([type=hidden]), select, textarea');
+    var visible = 0;
+    for (var j = 0; j < inputs.length; j++) {
+        if (isVisible(inputs[j])) visible++;
+    }
+    var score = visible * 10;
+    for (var c = 0; c < common.length; c++) {
+        var sel = "input[name*='" + common[c] + "' i], input[id*='" + common[c] + "' i]";
+        if (form.querySelector(sel)) score += 20;
+    }
+    if (form.querySelector('input[type=submit], button[type=submit]')) score += 30;
+    results.push({index: i, score: score, visibleInputs: visible});
+}
+return results;
+"""
+
+# Counts visible non-hidden inputs inside one form; used by the
+# single-form fast path to decide whether scoring can be skipped
+_JS_COUNT_VISIBLE_INPUTS = """
+var form = arguments[0];
+var inputs = form.querySelectorAll('input:not([type=hidden]), select, textarea');
+var visible = 0;
+for (var i = 0; i < inputs.length; i++) {
+    var e = inputs[i];
+    var s = getComputedStyle(e);
+    var r = e.getBoundingClientRect();
+    if (e.offsetParent !== null && r.width > 0 && r.height > 0 &&
+        s.visibility !== 'hidden' && s.display !== 'none') visible++;
+}
+return visible;
+"""
+
+# XPath generator shared by get_xpath and _batch_get_xpath; the id/name
+# shortcuts run in-page so Python never issues separate attribute calls
+_JS_GET_XPATH = """
+function getXPath(element) {
+    if (element.id) return `//*[@id="${element.id}"]`;
+    if (element.name && (element.tagName === 'INPUT' || element.tagName === 'SELECT' || element.tagName === 'TEXTAREA'))
+        return `//${element.tagName.toLowerCase()}[@name="${element.name}"]`;
+
+    let path = [];
+    while (element && element.nodeType === 1) {
+        let index = 1;
+        for (let sibling = element.previousSibling; sibling; sibling = sibling.previousSibling) {
+            if (sibling.nodeType === 1 && sibling.tagName === element.tagName) index++;
+        }
+        path.unshift(`${element.tagName.toLowerCase()}[${index}]`);
+        element = element.parentNode;
+    }
+    return `/${path.join('/')}`;
+}
+"""
+
+# Batch visibility and attribute fetchers; bodies read arguments[0] so the
+# same source works inline and wrapped as a page helper below
+_JS_VISIBLE_MASK = """
+return arguments[0].map(function(e) {
+    var s = getComputedStyle(e);
+    var r = e.getBoundingClientRect();
+    return e.offsetParent !== null && r.width > 0 && r.height > 0 &&
+           s.visibility !== 'hidden' && s.display !== 'none';
+});
+"""
+
+_JS_IS_VISIBLE = """
+var e = arguments[0];
+var s = getComputedStyle(e);
+var r = e.getBoundingClientRect();
+return e.offsetParent !== null && s.visibility !== 'hidden' &&
+       s.display !== 'none' && r.width > 0 && r.height > 0;
+"""
+
+_JS_IS_REQUIRED = """
+var e = arguments[0];
+return e.required === true || e.getAttribute('aria-required') === 'true' ||
+       e.classList.contains('required');
+"""
+
+_JS_BATCH_ATTRS = """
+return arguments[0].map(function(e) {
+    return {type: e.type || e.tagName.toLowerCase(),
+            name: e.name || '', id: e.id || '',
+            placeholder: e.placeholder || '',
+            'aria-label': e.getAttribute('aria-label') || ''};
+});
+"""
+
+# Per-element processing snapshot: everything process_form_elements needs
+# (type, visibility, required state, xpath) read in one pass so the Python
+# loop never issues per-element WebDriver calls
+_JS_ELEMENT_SNAPSHOT = """
+return arguments[0].map(function(e) {
+    var s = getComputedStyle(e);
+    var r = e.getBoundingClientRect();
+    return {
+        type: e.type || e.tagName.toLowerCase(),
+        visible: e.offsetParent !== null && r.width > 0 && r.height > 0 &&
+                 s.visibility !== 'hidden' && s.display !== 'none',
+        required: e.required === true ||
+                  e.getAttribute('aria-required') === 'true' ||
+                  e.classList.contains('required'),
+        xpath: getXPath(e)
+    };
+});
+"""
+
+# Collects visible candidate elements from every form except the main
+# container in one pass: arguments are (forms, main_container, selector)
+_JS_OTHER_FORM_ELEMENTS = """
+var forms = arguments[0], main = arguments[1], sel = arguments[2];
+var out = [];
+for (var i = 0; i < forms.length; i++) {
+    var form = forms[i];
+    if (form === main) continue;
+    var els = form.querySelectorAll(sel);
+    for (var j = 0; j < els.length; j++) {
+        var e = els[j];
+        var s = getComputedStyle(e);
+        var r = e.getBoundingClientRect();
+        if (e.offsetParent !== null && r.width > 0 && r.height > 0 &&
+            s.visibility !== 'hidden' && s.display !== 'none') out.push(e);
+    }
+}
+return out;
+"""
+
+# Finds the first checkbox/radio whose attributes, parent text or label
+# match the privacy-terms regex: arguments are (elements, pattern)
+_JS_FIND_PRIVACY = """
+var els = arguments[0];
+var re = new RegExp(arguments[1], 'i');
+for (var i = 0; i < els.length; i++) {
+    var e = els[i];
+    if (e.type !== 'checkbox' && e.type !== 'radio') continue;
+    var text = (e.name || '') + ' ' + (e.id || '') + ' ' +
+               (e.getAttribute('aria-label') || '');
+    if (re.test(text)) return e;
+    if (e.parentElement && re.test(e.parentElement.innerText || '')) return e;
+    if (e.id) {
+        var label = document.querySelector('label[for="' + CSS.escape(e.id) + '"]');
+        if (label && re.test(label.innerText || '')) return e;
+    }
+}
+return null;
+"""
+
+# The whole find_form_and_elements algorithm fused into one pass: form
+# scoring, winner selection (>=2 visible inputs preferred), visible
+# element collection via the union selector (arguments[0]), and the
+# other-forms/page-wide fallbacks. Returns [container, elements] or null.
+_JS_FIND_FORM_AND_ELEMENTS = """
+var sel = arguments[0];
+function isVisible(e) {
+    var s = getComputedStyle(e);
+    var r = e.getBoundingClientRect();
+    return e.offsetParent !== null && r.width > 0 && r.height > 0 &&
+           s.visibility !== 'hidden' && s.display !== 'none';
+}
+function collect(root, out, seen) {
+    var els = root.querySelectorAll(sel);
+    for (var i = 0; i < els.length; i++) {
+        var e = els[i];
+        if (!seen.has(e) && isVisible(e)) { seen.add(e); out.push(e); }
+    }
+}
+var forms = document.forms;
+var container = null;
+if (forms.length === 0) {
+    if (!document.querySelector('input')) return null;
+    container = document.body;
+} else if (forms.length === 1) {
+    container = forms[0];
+} else {
+    var common = ['email', 'name', 'first', 'last', 'phone', 'address'];
+    var best = null, bestScore = -1;
+    var bestWithInputs = null, bestWithScore = -1;
+    for (var i = 0; i < forms.length; i++) {
+        var form = forms[i];
+        var inputs = form.querySelectorAll('input:not([type=hidden]), select, textarea');
+        var visible = 0;
+        for (var j = 0; j < inputs.length; j++) {
+            if (isVisible(inputs[j])) visible++;
+        }
+        var score = visible * 10;
+        for (var c = 0; c < common.length; c++) {
+            var s = "input[name*='" + common[c] + "' i], input[id*='" + common[c] + "' i]";
+            if (form.querySelector(s)) score += 20;
+        }
+        if (form.querySelector('input[type=submit], button[type=submit]')) score += 30;
+        if (score > bestScore) { bestScore = score; best = form; }
+        if (visible >= 2 && score > bestWithScore) {
+            bestWithScore = score;
+            bestWithInputs = form;
+        }
+    }
+    container = bestWithInputs || best || forms[0];
+}
+var out = [], seen = new Set();
+collect(container, out, seen);
+if (out.length < 3) {
+    for (var i = 0; i < forms.length; i++) {
+        if (forms[i] !== container) collect(forms[i], out, seen);
+    }
+    if (out.length < 3) collect(document, out, seen);
+}
+return [container, out];
+"""
+
+# Submit-button search in one pass: union selector, in-page visibility
+# filter, then submit-like text match with visible buttons as fallback
+_JS_FIND_SUBMITS = """
+var union = document.querySelectorAll(
+    'input[type=submit], button[type=submit], .submit-button, ' +
+    'button.submit, input.submit, .btn-primary, button');
+var kws = ['submit', 'send', 'register', 'sign up'];
+var visible = [];
+for (var i = 0; i < union.length; i++) {
+    var e = union[i];
+    var s = getComputedStyle(e);
+    var r = e.getBoundingClientRect();
+    if (e.offsetParent !== null && r.width > 0 && r.height > 0 &&
+        s.visibility !== 'hidden' && s.display !== 'none') visible.push(e);
+}
+var matched = visible.filter(function(b) {
+    var text = ((b.innerText || '') + ' ' + (b.value || '')).toLowerCase();
+    return kws.some(function(k) { return text.indexOf(k) !== -1; });
+});
+return matched.length ? matched : visible;
+"""
+
+# Helper bundle registered once per page load via CDP; hot-path scripts
+# then invoke window.__fa_* by name instead of re-shipping and re-parsing
+# the same function source on every execute_script call
+_HELPERS_JS = (
+    _JS_GET_XPATH +
+    "window.__fa_getXPath = getXPath;\n"
+    "window.__fa_batchGetXPath = function() {"
+    " return Array.prototype.map.call(arguments[0], getXPath); };\n"
+    "window.__fa_isVisible = function() {" + _JS_IS_VISIBLE + "};\n"
+    "window.__fa_isRequired = function() {" + _JS_IS_REQUIRED + "};\n"
+    "window.__fa_visibleMask = function() {" + _JS_VISIBLE_MASK + "};\n"
+    "window.__fa_batchAttrs = function() {" + _JS_BATCH_ATTRS + "};\n"
+    "window.__fa_elementSnapshot = function() {" + _JS_ELEMENT_SNAPSHOT + "};\n"
+    "window.__fa_scoreForms = function() {" + _JS_SCORE_FORMS + "};\n"
+    "window.__fa_otherFormElements = function() {"
+    + _JS_OTHER_FORM_ELEMENTS + "};\n"
+    "window.__fa_findPrivacy = function() {" + _JS_FIND_PRIVACY + "};\n"
+    "window.__fa_findSubmits = function() {" + _JS_FIND_SUBMITS + "};\n"
+    "window.__fa_findFormAndElements = function() {"
+    + _JS_FIND_FORM_AND_ELEMENTS + "};\n"
+    "window.__fa_countVisibleInputs = function() {"
+    + _JS_COUNT_VISIBLE_INPUTS + "};\n"
+)
+
+# Every element kind worth collecting from a form, as one union selector
+# so each tier of find_form_and_elements costs a single query
+_FORM_ELEMENT_SELECTOR = ", ".join([
+    "input:not([type='hidden'])",
+    "select",
+    "textarea",
+    "button",
+    "div[role='button']",
+    "span[role='button']"
+])
+
+# Remaining hot-path term/selector lists, hoisted so calls never rebuild
+# them; the inline tuples they replace were re-allocated per invocation
+_CAPTCHA_MARKERS = (
+    "recaptcha", "hcaptcha", "g-recaptcha", "h-captcha",
+    "turnstile", "data-sitekey", "captcha challenge",
+    "robot verification"
+)
+_SUBMIT_TERMS = ("submit", "send", "register", "sign up")
+_SUBMIT_SELECTORS = (
+    "input[type='submit']",
+    "button[type='submit']",
+    ".submit-button",
+    "button.submit",
+    "input.submit",
+    ".btn-primary",
+    "button"
+)
+_COOKIE_BUTTON_SELECTORS = (
+    "button[contains(., 'Accept')]",
+    "button[contains(., 'Cookie')]",
+    "button[contains(., 'I agree')]",
+    "a[contains(., 'Accept')]",
+    ".cookie-banner button",
+    "#cookie-notice button",
+    ".consent-banner button",
+    "div[class*='cookie'] button",
+    "div[class*='gdpr'] button",
+    "div[id*='cookie'] button",
+    ".modal button"
+)
+
+# Privacy/consent wording, compiled once: a single case-insensitive scan
+# replaces six substring checks plus a lowercasing per value
+_PRIVACY_RE = re.compile(r'privacy|terms|policy|agree|consent|gdpr',
+                         re.IGNORECASE)
+
+# First/last name disambiguation, compiled once instead of per element
+_NAME_RE = re.compile(r'(?:^|_|-)(?:first|last)(?:_|-|$|name)')
+
+# Challenge phrases, compiled into one alternation so a single scan of the
+# lowercased page source matches them all
+_CAPTCHA_PHRASE_RE = re.compile('|'.join(re.escape(p) for p in [
+    "type the characters",
+    "characters you see in the image",
+    "enter the text",
+    "security code",
+    "verification code",
+    "anti-spam",
+    "i am not a robot",
+    "prove you are human",
+    "human verification"
+]))
+
 class FormAnalyzer:
     def __init__(self, driver):
         self.driver = driver
-    
+        # Lazily built per-field matchers for candidate scoring
+        self._field_pattern_res = {}
+        self._scoring_automaton = None
+        # XPaths keyed by WebElement remote-ref id, which is stable for the
+        # page load; repeat lookups skip the JS round-trip
+        self._xpath_cache = {}
+        # Register the JS helpers on every future page load so hot-path
+        # calls invoke them by name; non-Chrome drivers just skip this
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                                   {"source": _HELPERS_JS})
+        except Exception as e:
+            logger.debug("Could not pre-register JS helpers: %s", e)
+
+    def _run_js(self, helper, fallback_script, *args):
+        """Invoke a pre-injected window helper by name, falling back to the
+        inlined source when the helper is absent (CDP unavailable, or the
+        page was loaded before this analyzer attached)"""
+        return self.driver.execute_script(
+            f"if (window.{helper}) return window.{helper}.apply(null, arguments);\n"
+            + fallback_script, *args)
+
+    def _get_field_res(self, field_name, field_detector):
+        """Combined substring and word-boundary matchers for one field's
+        patterns, compiled on first use and memoized"""
+        cached = self._field_pattern_res.get(field_name)
+        if cached is None:
+            patterns = field_detector.field_patterns.get(field_name, [])
+            escaped = '|'.join(re.escape(p) for p in patterns) or r'(?!)'
+            cached = (re.compile(escaped),
+                      re.compile(r'\b(?:' + escaped + r')\b'))
+            self._field_pattern_res[field_name] = cached
+        return cached
+
+    def _get_scoring_automaton(self, field_detector):
+        """Aho-Corasick automaton over every field's literal patterns, built
+        once; each word maps to (length, [fields]) so patterns shared by
+        several fields score for all of them"""
+        if ahocorasick is None:
+            return None
+        if self._scoring_automaton is None:
+            automaton = ahocorasick.Automaton()
+            for field, patterns in field_detector.field_patterns.items():
+                for pattern in patterns:
+                    if '.*' in pattern:
+                        continue
+                    existing = automaton.get(pattern, None)
+                    if existing is None:
+                        automaton.add_word(pattern, (len(pattern), [field]))
+                    elif field not in existing[1]:
+                        existing[1].append(field)
+            automaton.make_automaton()
+            self._scoring_automaton = automaton
+        return self._scoring_automaton
+
+    def _visible_mask(self, elements):
+        """Visibility of every element in one JS round-trip; returns None if
+        the batch call fails"""
+        if not elements:
+            return []
+        try:
+            return self._run_js('__fa_visibleMask', _JS_VISIBLE_MASK, elements)
+        except Exception as e:
+            logger.debug("Error batch-checking visibility: %s", e)
+            return None
+
+    def _filter_visible(self, elements):
+        """Keep only visible elements, using one batched JS call with the
+        per-element check as fallback"""
+        mask = self._visible_mask(elements)
+        if mask is None:
+            return [e for e in elements if self.is_element_visible(e)]
+        return [e for e, visible in zip(elements, mask) if visible]
+
+    def _batch_attrs(self, elements):
+        """Fetch type/name/id/placeholder/aria-label for every element in a
+        single JS round-trip; returns None if the batch call fails"""
+        if not elements:
+            return []
+        try:
+            return self._run_js('__fa_batchAttrs', _JS_BATCH_ATTRS, elements)
+        except Exception as e:
+            logger.debug("Error batch-fetching element attributes: %s", e)
+            return None
+
+    def batch_element_snapshot(self, elements):
+        """Type, visibility, required state and xpath for every element in
+        one JS round-trip; returns None if the batch call fails"""
+        if not elements:
+            return []
+        try:
+            snapshot = self._run_js('__fa_elementSnapshot',
+                                    _JS_GET_XPATH + _JS_ELEMENT_SNAPSHOT,
+                                    elements)
+            if isinstance(snapshot, list) and len(snapshot) == len(elements):
+                for element, meta in zip(elements, snapshot):
+                    self._xpath_cache[element._id] = meta['xpath']
+                return snapshot
+        except Exception as e:
+            logger.debug("Error batch-snapshotting elements: %s", e)
+        return None
+
     def has_captcha(self):
         """
         Comprehensive detection of all CAPTCHA types including:
@@ -18,102 +500,58 @@ class FormAnalyzer:
         - Text-based CAPTCHA challenges
         """
         try:
-            # 1. Check for reCAPTCHA and hCAPTCHA elements
-            recaptcha_selectors = [
-                "iframe[src*='recaptcha']",
-                "iframe[src*='hcaptcha']",
-                "div.g-recaptcha",
-                "div[data-sitekey]",  
-                "div.h-captcha",
-                "[class*='turnstile']"
-            ]
-            
-            for selector in recaptcha_selectors:
-                if self.driver.find_elements(By.CSS_SELECTOR, selector):
-                    return True
-                    
-            # 2. Check for image-based CAPTCHAs
-            image_captcha_selectors = [
-                "img[src*='captcha']",
-                "img[alt*='captcha']",
-                "img[id*='captcha']",
-                "img[class*='captcha']",
-                "div[id*='captcha'] img"
-            ]
-            
-            for selector in image_captcha_selectors:
-                if self.driver.find_elements(By.CSS_SELECTOR, selector):
-                    return True
-                    
-            # 3. Check for CAPTCHA inputs and labels
-            captcha_input_selectors = [
-                "input[name*='captcha']",
-                "input[id*='captcha']", 
-                "#captcha",
-                ".captcha input"
-            ]
-            
-            for selector in captcha_input_selectors:
-                if self.driver.find_elements(By.CSS_SELECTOR, selector):
-                    return True
-                    
-            # 4. Check for CAPTCHA text in labels, spans, paragraphs
-            captcha_phrases = [
-                "type the characters",
-                "characters you see in the image", 
-                "enter the text",
-                "security code",
-                "verification code",
-                "anti-spam",
-                "i am not a robot",
-                "prove you are human",  # Fixed: removed apostrophe
-                "human verification"
-            ]
-            
-            for phrase in captcha_phrases:
-                # Using double quotes for the XPath expression to avoid issues with apostrophes
-                xpath_selectors = [
-                    f'//label[contains(translate(text(), "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"), "{phrase}")]',
-                    f'//p[contains(translate(text(), "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"), "{phrase}")]',
-                    f'//span[contains(translate(text(), "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"), "{phrase}")]',
-                    f'//div[contains(translate(text(), "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"), "{phrase}")]'
-                ]
-                
-                for xpath in xpath_selectors:
-                    try:
-                        if self.driver.find_elements(By.XPATH, xpath):
-                            return True
-                    except Exception as e:
-                        # Skip invalid XPath expressions
-                        logger.debug(f"XPath error in CAPTCHA detection: {str(e)}")
-                        continue
-                    
-            # 5. Check for CAPTCHA-related scripts
-            captcha_scripts = [
-                "script[src*='recaptcha']",
-                "script[src*='hcaptcha']",
-                "script[src*='captcha']",
-                "script[src*='turnstile']"
-            ]
-            
-            for selector in captcha_scripts:
-                if self.driver.find_elements(By.CSS_SELECTOR, selector):
-                    return True
-                    
-            # 6. Check page source for common CAPTCHA terms
+            # Fetch the page source once and reuse it for every text signal;
+            # the DOM doesn't change between the checks below
             page_source = self.driver.page_source.lower()
-            if any(term in page_source for term in ["recaptcha", "hcaptcha", "captcha challenge", "robot verification"]):
+
+            # 1. Unambiguous markers anywhere in the source: widget classes,
+            # script/iframe URLs, sitekey attributes
+            if any(term in page_source for term in _CAPTCHA_MARKERS):
                 return True
-                    
+
+            # 2. Challenge phrases
+            if _CAPTCHA_PHRASE_RE.search(page_source):
+                return True
+
+            # 3. Everything else requires the word to appear at all; skip
+            # the DOM queries entirely when it doesn't
+            if "captcha" not in page_source:
+                return False
+
+            # 4. Confirm ambiguous mentions with the grouped DOM selectors
+            for selector in (_IMAGE_CAPTCHA_SELECTOR, _CAPTCHA_INPUT_SELECTOR,
+                             _CAPTCHA_SCRIPT_SELECTOR):
+                if self.driver.execute_script(
+                        "return document.querySelector(arguments[0]) !== null;", selector):
+                    return True
+
             return False
-            
+
         except Exception as e:
-            logger.warning(f"Error in CAPTCHA detection: {str(e)}")
+            logger.warning("Error in CAPTCHA detection: %s", e)
             # Default to assuming no CAPTCHA if we had an error
             return False
     
     def find_form_and_elements(self):
         """Find the main form and all its visible elements - with error handling"""
+        # Remote-ref ids are only valid for the current page load; drop the
+        # previous page's XPaths so the cache can't grow across a long run
+        self._xpath_cache.clear()
+        # Discovery, scoring, winner selection and element collection all
+        # run fused in-page: one round-trip replaces the whole ladder below
+        try:
+            result = self._run_js('__fa_findFormAndElements',
+                                  _JS_FIND_FORM_AND_ELEMENTS,
+                                  _FORM_ELEMENT_SELECTOR)
+            if result is None:
+                return None, []
+            return result[0], result[1]
+        except Exception as e:
+            logger.debug("Error in fused form search, falling back: %s", e)
+        return self._find_form_and_elements_fallback()
+
+    def _find_form_and_elements_fallback(self):
+        """Stepwise form search used when the fused in-page pass fails"""
         try:
             # Find all forms
             forms = self.driver.find_elements(By.TAG_NAME, "form")
@@ -130,44 +568,41 @@ class FormAnalyzer:
                         return None, []
                 else:
                     return None, []
+            elif len(forms) == 1:
+                # Single-form fast path: when the only form has enough
+                # visible inputs there is nothing to score, so skip the
+                # ranking pass entirely
+                try:
+                    visible_inputs = self._run_js(
+                        '__fa_countVisibleInputs', _JS_COUNT_VISIBLE_INPUTS,
+                        forms[0])
+                except Exception as e:
+                    logger.debug("Error counting form inputs: %s", e)
+                    visible_inputs = 0
+                main_container = forms[0]
+                if visible_inputs < 3:
+                    # Thin form; fall through to the usual element
+                    # collection, which already widens the search
+                    logger.debug("Single form has only %s visible inputs", visible_inputs)
             else:
-                # Try to find the most promising form
+                # Try to find the most promising form: score them all with
+                # one in-page pass instead of several round-trips per form
                 candidate_forms = []
-                
-                for form in forms:
+
+                try:
+                    scores = self._run_js('__fa_scoreForms', _JS_SCORE_FORMS)
+                except Exception as e:
+                    logger.debug("Error scoring forms in-page: %s", e)
+                    scores = []
+
+                for entry in scores:
                     try:
-                        # Count visible input elements
-                        visible_inputs = len([e for e in form.find_elements(By.CSS_SELECTOR, 
-                                             "input:not([type='hidden']), select, textarea") 
-                                             if self.is_element_visible(e)])
-                        
-                        # Look for common form indicators
-                        form_score = visible_inputs * 10  # Base score on number of fields
-                        
-                        # Boost forms with common input field names
-                        common_fields = ["email", "name", "first", "last", "phone", "address"]
-                        for field in common_fields:
-                            try:
-                                if form.find_elements(By.CSS_SELECTOR, f"input[name*='{field}' i], input[id*='{field}' i]"):
-                                    form_score += 20
-                            except:
-                                pass
-                        
-                        # Boost forms with submit buttons
-                        try:
-                            if form.find_elements(By.CSS_SELECTOR, "input[type='submit'], button[type='submit']"):
-                                form_score += 30
-                        except:
-                            pass
-                            
-                        # Add form with its score to candidates
-                        candidate_forms.append((form, form_score, visible_inputs))
-                    except StaleElementReferenceException:
+                        candidate_forms.append((forms[entry['index']],
+                                                entry['score'],
+                                                entry['visibleInputs']))
+                    except (IndexError, KeyError, TypeError):
                         continue
-                    except Exception as e:
-                        logger.debug(f"Error scoring form: {str(e)}")
-                        continue
-                
+
                 # Sort by score (descending)
                 candidate_forms.sort(key=lambda x: x[1], reverse=True)
                 
@@ -189,139 +624,125 @@ class FormAnalyzer:
                         logger.warning("Could not access forms list")
                         return None, []
             
-            # Collect all visible elements from the container
+            # Collect all visible elements from the container: the union
+            # selector lets the browser match every element kind in one
+            # query per tier instead of six
             all_form_elements = []
-            selectors = [
-                "input:not([type='hidden'])", 
-                "select", 
-                "textarea", 
-                "button",
-                "div[role='button']",
-                "span[role='button']"
-            ]
-            
+
             try:
-                for selector in selectors:
-                    try:
-                        elements = main_container.find_elements(By.CSS_SELECTOR, selector)
-                        for element in elements:
-                            if self.is_element_visible(element):
-                                all_form_elements.append(element)
-                    except StaleElementReferenceException:
-                        continue
-                    except Exception as e:
-                        logger.debug(f"Error finding elements with selector {selector}: {str(e)}")
+                elements = main_container.find_elements(
+                    By.CSS_SELECTOR, _FORM_ELEMENT_SELECTOR)
+                all_form_elements.extend(self._filter_visible(elements))
+            except StaleElementReferenceException:
+                pass
             except Exception as e:
-                logger.warning(f"Error collecting form elements: {str(e)}")
-            
+                logger.warning("Error collecting form elements: %s", e)
+
             # If few elements found in the main form, search nearby forms or the entire page
             if len(all_form_elements) < 3:
-                # First try: look in all other forms 
-                for form in forms:
-                    if form != main_container:
-                        try:
-                            for selector in selectors:
-                                try:
-                                    elements = form.find_elements(By.CSS_SELECTOR, selector)
-                                    for element in elements:
-                                        if self.is_element_visible(element):
-                                            all_form_elements.append(element)
-                                except:
-                                    continue
-                        except:
-                            continue
-                
+                # First try: sweep all other forms in one in-page pass,
+                # with visibility filtered in-browser
+                if forms:
+                    try:
+                        all_form_elements.extend(self._run_js(
+                            '__fa_otherFormElements', _JS_OTHER_FORM_ELEMENTS,
+                            forms, main_container, _FORM_ELEMENT_SELECTOR))
+                    except Exception as e:
+                        logger.debug("Error sweeping other forms: %s", e)
+
                 # Second try: if still not enough elements, look in the entire page
                 if len(all_form_elements) < 3:
-                    all_elements = []
-                    for selector in selectors:
-                        try:
-                            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                            for element in elements:
-                                if self.is_element_visible(element) and element not in all_form_elements:
-                                    all_elements.append(element)
-                        except:
-                            continue
-                    all_form_elements.extend(all_elements)
+                    # Dedupe on the remote-ref id: a set lookup per element
+                    # instead of O(N^2) WebElement equality round-trips
+                    seen_ids = {element._id for element in all_form_elements}
+                    try:
+                        elements = self.driver.find_elements(
+                            By.CSS_SELECTOR, _FORM_ELEMENT_SELECTOR)
+                        for element in self._filter_visible(elements):
+                            if element._id not in seen_ids:
+                                seen_ids.add(element._id)
+                                all_form_elements.append(element)
+                    except:
+                        pass
                 
             return main_container, all_form_elements
             
         except Exception as e:
-            logger.error(f"Error finding form and elements: {str(e)}")
+            logger.error("Error finding form and elements: %s", e)
             return None, []
     
     def get_xpath(self, element):
         """Generate optimized XPath for an element with error handling"""
+        cached = self._xpath_cache.get(element._id)
+        if cached is not None:
+            return cached
+
+        # The id/name shortcuts live in the JS, so one round-trip covers
+        # every case instead of up to three get_attribute calls first
         try:
-            # First try to create an optimal XPath using ID if available
-            element_id = element.get_attribute('id')
-            if element_id and element_id.strip():
-                return f"//*[@id='{element_id}']"
-                
-            # Next try name for inputs
-            if element.tag_name in ['input', 'select', 'textarea']:
-                name = element.get_attribute('name')
-                if name and name.strip():
-                    return f"//{element.tag_name}[@name='{name}']"
-                    
-            # Use JavaScript as fallback
+            xpath = self._run_js(
+                '__fa_getXPath',
+                _JS_GET_XPATH + "return getXPath(arguments[0]);", element)
+            self._xpath_cache[element._id] = xpath
+            return xpath
+        except JavascriptException as js_e:
+            logger.debug("JavaScript error in XPath generation: %s", js_e)
+            # Fallback - simple XPath
             try:
-                return self.driver.execute_script("""
-                    function getXPath(element) {
-                        if (element.id) return `//*[@id="${element.id}"]`;
-                        if (element.name && (element.tagName === 'INPUT' || element.tagName === 'SELECT' || element.tagName === 'TEXTAREA')) 
-                            return `//${element.tagName.toLowerCase()}[@name="${element.name}"]`;
-                        
-                        let path = [];
-                        while (element && element.nodeType === 1) {
-                            let index = 1;
-                            for (let sibling = element.previousSibling; sibling; sibling = sibling.previousSibling) {
-                                if (sibling.nodeType === 1 && sibling.tagName === element.tagName) index++;
-                            }
-                            path.unshift(`${element.tagName.toLowerCase()}[${index}]`);
-                            element = element.parentNode;
-                        }
-                        return `/${path.join('/')}`;
-                    }
-                    return getXPath(arguments[0]);
-                """, element)
-            except JavascriptException as js_e:
-                logger.debug(f"JavaScript error in XPath generation: {str(js_e)}")
-                # Fallback - simple XPath
                 tag = element.tag_name
-                try:
-                    # Try to use class if available
-                    element_class = element.get_attribute('class')
-                    if element_class and ' ' not in element_class:
-                        return f"//{tag}[@class='{element_class}']"
-                except:
-                    pass
+                element_class = element.get_attribute('class')
+                if element_class and ' ' not in element_class:
+                    xpath = f"//{tag}[@class='{element_class}']"
+                    self._xpath_cache[element._id] = xpath
+                    return xpath
+            except:
+                pass
         except Exception as e:
-            logger.debug(f"Error in XPath generation: {str(e)}")
-            
-        # Last resort - very simple path based on tag
+            logger.debug("Error in XPath generation: %s", e)
+
+        # Last resort - very simple path based on tag (not cached: a later
+        # call may succeed with a better path)
         try:
             tag = element.tag_name
             return f"//{tag}"
         except:
             return "//unknown"
+
+    def _batch_get_xpath(self, elements):
+        """Generate XPaths for a list of elements in one round-trip"""
+        if not elements:
+            return []
+        try:
+            xpaths = self._run_js(
+                '__fa_batchGetXPath',
+                _JS_GET_XPATH +
+                "return Array.prototype.map.call(arguments[0], getXPath);",
+                elements)
+            if isinstance(xpaths, list) and len(xpaths) == len(elements):
+                for element, xpath in zip(elements, xpaths):
+                    self._xpath_cache[element._id] = xpath
+                return xpaths
+        except Exception as e:
+            logger.debug("Error batch-generating XPaths: %s", e)
+        return [self.get_xpath(element) for element in elements]
     
     def is_element_visible(self, element):
         """Check if an element is visible and usable - with error handling"""
+        # One JS round-trip; the old is_displayed/size/css chain cost three
         try:
-            return (element.is_displayed() and 
-                    element.size['width'] > 0 and 
-                    element.size['height'] > 0 and
-                    element.value_of_css_property('visibility') != 'hidden')
+            return bool(self._run_js('__fa_isVisible', _JS_IS_VISIBLE,
+                                     element))
         except Exception:
             return False
     
     def is_element_required(self, element):
         """Check if a form element is required - with error handling"""
+        # One JS round-trip instead of three attribute fetches; the
+        # classList check also stops substrings like 'not-required' from
+        # matching the way the old 'in class' test did
         try:
-            return (element.get_attribute("required") == "true" or 
-                   element.get_attribute("aria-required") == "true" or
-                   "required" in (element.get_attribute("class") or ""))
+            return bool(self._run_js('__fa_isRequired', _JS_IS_REQUIRED,
+                                     element))
         except Exception:
             return False
     
@@ -331,7 +752,7 @@ class FormAnalyzer:
             button_text = element.text.strip().lower()
             button_value = (element.get_attribute("value") or "").lower()
             
-            if any(term in button_text or term in button_value for term in ["submit", "send", "register", "sign up"]):
+            if any(term in button_text or term in button_value for term in _SUBMIT_TERMS):
                 if not result['fields']['Submit']['found']:
                     result['fields']['Submit'] = {
                         'xpath': self.get_xpath(element),
@@ -344,56 +765,55 @@ class FormAnalyzer:
     
     def find_submit_buttons(self):
         """Find submit buttons using various methods - with error handling"""
-        # Try these selectors in order
-        selectors = [
-            "input[type='submit']",
-            "button[type='submit']",
-            ".submit-button",
-            "button.submit",
-            "input.submit",
-            ".btn-primary", 
-            "button"
-        ]
-        
-        for selector in selectors:
+        # One in-page pass over the selector union: visibility filter and
+        # text match both happen in-browser
+        try:
+            return self._run_js('__fa_findSubmits', _JS_FIND_SUBMITS) or []
+        except Exception as e:
+            logger.debug("Error finding submit buttons in-page: %s", e)
+
+        # Per-selector fallback when the batch call failed
+        for selector in _SUBMIT_SELECTORS:
             try:
                 buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                visible_buttons = []
-                for button in buttons:
-                    try:
-                        if self.is_element_visible(button):
-                            visible_buttons.append(button)
-                    except StaleElementReferenceException:
-                        continue
-                    except Exception as e:
-                        logger.debug(f"Error checking button visibility: {str(e)}")
-                
+                visible_buttons = self._filter_visible(buttons)
+
                 # First check for buttons with submit-like text
                 for button in visible_buttons:
                     try:
                         text = (button.text or "").lower()
                         value = (button.get_attribute("value") or "").lower()
                         
-                        if any(term in text or term in value for term in ["submit", "send", "register", "sign up"]):
+                        if any(term in text or term in value for term in _SUBMIT_TERMS):
                             return [button]
                     except StaleElementReferenceException:
                         continue
                     except Exception as e:
-                        logger.debug(f"Error checking button text: {str(e)}")
+                        logger.debug("Error checking button text: %s", e)
                 
                 # If no text match, return any visible buttons of this type
                 if visible_buttons:
                     return visible_buttons
             except Exception as e:
-                logger.debug(f"Error finding buttons with selector {selector}: {str(e)}")
+                logger.debug("Error finding buttons with selector %s: %s", selector, e)
         
         # No buttons found
         return []
     
     def find_privacy_checkbox(self, elements):
         """Find a privacy/terms checkbox in the form - with error handling"""
-        privacy_terms = ["privacy", "terms", "policy", "agree", "consent", "gdpr"]
-        
+        if not elements:
+            return None
+
+        # Whole search in one round-trip: attributes, parent text and
+        # label[for] lookups all happen in-page
+        try:
+            return self._run_js('__fa_findPrivacy', _JS_FIND_PRIVACY,
+                                elements, _PRIVACY_RE.pattern)
+        except Exception as e:
+            logger.debug("Error finding privacy checkbox in-page: %s", e)
+
+        # Per-element fallback when the batch call failed
         for element in elements:
             try:
                 element_type = element.get_attribute("type")
@@ -401,74 +821,94 @@ class FormAnalyzer:
                     # Check element attributes
                     for attr in ['name', 'id', 'aria-label']:
                         try:
-                            value = (element.get_attribute(attr) or "").lower()
-                            if any(term in value for term in privacy_terms):
+                            if _PRIVACY_RE.search(element.get_attribute(attr) or ""):
                                 return element
                         except:
                             continue
-                    
+
                     # Check nearby text (parent and labels)
                     try:
                         # Parent text
                         parent = element.find_element(By.XPATH, "./..")
-                        if any(term in parent.text.lower() for term in privacy_terms):
+                        if _PRIVACY_RE.search(parent.text):
                             return element
-                            
+
                         # Associated label
                         element_id = element.get_attribute('id')
                         if element_id:
                             labels = self.driver.find_elements(By.CSS_SELECTOR, f"label[for='{element_id}']")
                             for label in labels:
-                                if any(term in label.text.lower() for term in privacy_terms):
+                                if _PRIVACY_RE.search(label.text):
                                     return element
                     except:
                         pass
             except StaleElementReferenceException:
                 continue
             except Exception as e:
-                logger.debug(f"Error checking for privacy checkbox: {str(e)}")
+                logger.debug("Error checking for privacy checkbox: %s", e)
         
         return None
     
     def find_best_candidate_for_field(self, elements, field_name, field_detector):
         """Find the best candidate for a specific field from a list of elements - with error handling"""
-        candidates = []
-        patterns = field_detector.field_patterns.get(field_name, [])
-        
-        for element in elements:
+        # Parallel element/score lists: picking the best is then a max over
+        # a flat score list rather than sorting tuples with a lambda key
+        candidate_elems = []
+        candidate_scores = []
+        sub_re, word_re = self._get_field_res(field_name, field_detector)
+        automaton = self._get_scoring_automaton(field_detector)
+
+        # One round-trip for all attributes; scoring below is pure Python
+        attr_dicts = self._batch_attrs(elements)
+        if attr_dicts is None:
+            attr_dicts = [None] * len(elements)
+
+        for element, batched in zip(elements, attr_dicts):
             try:
-                element_type = element.get_attribute("type") or element.tag_name
+                if batched is not None:
+                    element_type = batched['type']
+                    attrs = {attr: batched[attr].lower()
+                             for attr in ('name', 'id', 'placeholder', 'aria-label')}
+                else:
+                    # Per-element fallback when the batch call failed
+                    element_type = element.get_attribute("type") or element.tag_name
+                    attrs = {}
+                    for attr in ['name', 'id', 'placeholder', 'aria-label']:
+                        try:
+                            attrs[attr] = (element.get_attribute(attr) or "").lower()
+                        except:
+                            attrs[attr] = ""
+
                 if element_type == 'hidden':
                     continue
-                
+
                 # Score based on element type
                 score = 0
                 if ((field_name == "Email" and element_type == "email") or
                     (field_name == "Phone" and element_type == "tel")):
                     score += 50
-                
-                # Score based on attributes
-                attrs = {}
-                for attr in ['name', 'id', 'placeholder', 'aria-label']:
-                    try:
-                        attrs[attr] = (element.get_attribute(attr) or "").lower()
-                    except:
-                        attrs[attr] = ""
-                
-                # Check for direct matches in attributes
+
+                # Check for direct matches in attributes: one combined scan
+                # per attribute instead of a loop over every pattern
                 for attr, value in attrs.items():
                     if value:
-                        # Direct pattern matches
-                        for pattern in patterns:
-                            if pattern in value:
+                        if automaton is not None:
+                            sub_hit, word_hit = _automaton_hits(
+                                automaton, value, field_name)
+                            if sub_hit:
                                 score += 30
-                            if re.search(r'\b' + re.escape(pattern) + r'\b', value):
+                            if word_hit:
                                 score += 50
-                        
+                        else:
+                            if sub_re.search(value):
+                                score += 30
+                            if word_re.search(value):
+                                score += 50
+
                         # Special case for name fields
                         if field_name in ["FirstName", "LastName"]:
                             try:
-                                name_match = re.search(r'(?:^|_|-)(?:first|last)(?:_|-|$|name)', value)
+                                name_match = _NAME_RE.search(value)
                                 if name_match:
                                     field_part = name_match.group(0)
                                     if (field_name == "FirstName" and "first" in field_part) or \
@@ -479,61 +919,141 @@ class FormAnalyzer:
                     
                 # If score is positive, add to candidates
                 if score > 0:
-                    candidates.append((element, score))
+                    candidate_elems.append(element)
+                    candidate_scores.append(score)
             except StaleElementReferenceException:
                 continue
             except Exception as e:
-                logger.debug(f"Error evaluating field candidate: {str(e)}")
+                logger.debug("Error evaluating field candidate: %s", e)
                 continue
             
         # If there are multiple text fields with 'name' in the attribute but no specific first/last
         # Try to make an educated guess based on field order
-        if field_name in ["FirstName", "LastName"] and not candidates:
+        if field_name in ["FirstName", "LastName"] and not candidate_elems:
             name_fields = []
-            for element in elements:
+            for element, batched in zip(elements, attr_dicts):
                 try:
-                    element_type = element.get_attribute("type")
-                    if element_type == 'text':
-                        for attr in ['name', 'id', 'placeholder']:
-                            try:
-                                value = (element.get_attribute(attr) or "").lower()
-                                if 'name' in value and 'first' not in value and 'last' not in value:
-                                    name_fields.append(element)
-                                    break
-                            except:
-                                continue
+                    if batched is not None:
+                        if batched['type'] != 'text':
+                            continue
+                        values = (batched['name'], batched['id'], batched['placeholder'])
+                    else:
+                        if element.get_attribute("type") != 'text':
+                            continue
+                        values = tuple((element.get_attribute(attr) or "")
+                                       for attr in ('name', 'id', 'placeholder'))
+                    for value in values:
+                        value = value.lower()
+                        if 'name' in value and 'first' not in value and 'last' not in value:
+                            name_fields.append(element)
+                            break
                 except:
                     continue
             
             # If we have exactly two name fields, assume first=FirstName, second=LastName
             if len(name_fields) == 2:
                 if field_name == "FirstName":
-                    candidates.append((name_fields[0], 10))
+                    candidate_elems.append(name_fields[0])
                 else:  # LastName
-                    candidates.append((name_fields[1], 10))
-        
-        # Sort candidates by score and return the best one
-        candidates.sort(key=lambda x: x[1], reverse=True)
-        return candidates[0][0] if candidates else None
+                    candidate_elems.append(name_fields[1])
+                candidate_scores.append(10)
+
+        # Return the highest-scoring candidate (earliest wins ties, matching
+        # the old stable sort)
+        if not candidate_elems:
+            return None
+        best = max(range(len(candidate_scores)),
+                   key=candidate_scores.__getitem__)
+        return candidate_elems[best]
+
+    def find_best_candidates(self, elements, field_names, field_detector):
+        """Best candidate for each of several fields in one pass over the
+        elements (O(elements + fields) instead of one scan per field);
+        returns {field_name: element} for the fields that matched"""
+        field_names = list(field_names)
+        if not field_names or not elements:
+            return {}
+
+        # Name fields keep their extra heuristics (first/last bonus and the
+        # two-field ordering fallback) by going through the per-field scan
+        name_fields = [f for f in field_names
+                       if f in ("FirstName", "LastName")]
+        field_names = [f for f in field_names if f not in name_fields]
+
+        automaton = self._get_scoring_automaton(field_detector)
+        matchers = {f: self._get_field_res(f, field_detector)
+                    for f in field_names}
+
+        attr_dicts = self._batch_attrs(elements) if field_names else []
+        if attr_dicts is None:
+            attr_dicts = [None] * len(elements)
+
+        best_scores = dict.fromkeys(field_names, 0)
+        best_elems = {}
+        for element, batched in zip(elements, attr_dicts):
+            try:
+                if batched is not None:
+                    element_type = batched['type']
+                    attrs = [batched[attr].lower()
+                             for attr in ('name', 'id', 'placeholder', 'aria-label')]
+                else:
+                    # Per-element fallback when the batch call failed
+                    element_type = element.get_attribute("type") or element.tag_name
+                    attrs = []
+                    for attr in ['name', 'id', 'placeholder', 'aria-label']:
+                        try:
+                            attrs.append((element.get_attribute(attr) or "").lower())
+                        except:
+                            attrs.append("")
+
+                if element_type == 'hidden':
+                    continue
+
+                for field_name in field_names:
+                    score = 0
+                    if ((field_name == "Email" and element_type == "email") or
+                        (field_name == "Phone" and element_type == "tel")):
+                        score += 50
+
+                    sub_re, word_re = matchers[field_name]
+                    for value in attrs:
+                        if not value:
+                            continue
+                        if automaton is not None:
+                            sub_hit, word_hit = _automaton_hits(
+                                automaton, value, field_name)
+                            if sub_hit:
+                                score += 30
+                            if word_hit:
+                                score += 50
+                        else:
+                            if sub_re.search(value):
+                                score += 30
+                            if word_re.search(value):
+                                score += 50
+
+                    # Earliest element wins ties, as in the per-field scan
+                    if score > best_scores[field_name]:
+                        best_scores[field_name] = score
+                        best_elems[field_name] = element
+            except StaleElementReferenceException:
+                continue
+            except Exception as e:
+                logger.debug("Error evaluating field candidates: %s", e)
+                continue
+
+        for field_name in name_fields:
+            candidate = self.find_best_candidate_for_field(
+                elements, field_name, field_detector)
+            if candidate is not None:
+                best_elems[field_name] = candidate
+
+        return best_elems
 
     def dismiss_cookie_banners(driver):
         """Attempt to dismiss common cookie banners"""
         # Common cookie accept button selectors
-        cookie_button_selectors = [
-            "button[contains(., 'Accept')]",
-            "button[contains(., 'Cookie')]",
-            "button[contains(., 'I agree')]",
-            "a[contains(., 'Accept')]",
-            ".cookie-banner button",
-            "#cookie-notice button",
-            ".consent-banner button",
-            "div[class*='cookie'] button",
-            "div[class*='gdpr'] button",
-            "div[id*='cookie'] button",
-            ".modal button"
-        ]
-        
-        for selector in cookie_button_selectors:
+        for selector in _COOKIE_BUTTON_SELECTORS:
             try:
                 buttons = driver.find_elements(By.XPATH, f"//{selector}")
                 for button in buttons:
@@ -1,7 +1,18 @@
+import atexit
 import csv
+import json
+import re
+import signal
+import sqlite3
 import time
 import logging
 import os
+import threading
+import weakref
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from queue import Queue
 from urllib.parse import urlparse
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -10,9 +21,16 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.common.exceptions import StaleElementReferenceException, InvalidSessionIdException
+from selenium.common.exceptions import WebDriverException, NoSuchWindowException, SessionNotCreatedException
 from field_detector import FieldDetector
 from form_analyzer import FormAnalyzer
 
+# Optional: psutil lets browser maintenance check real memory use
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, 
                     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -20,13 +38,97 @@ logging.basicConfig(level=logging.INFO,
                               logging.StreamHandler()])
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=4096)
+def _netloc(url):
+    """Network location of a URL; urlparse is pure Python, so memoize it
+    across the several per-URL call sites"""
+    return urlparse(url).netloc
+
+
+# Minimum spacing between hits to the same domain, replacing the old
+# blanket 1-second sleep between every URL
+_MIN_DOMAIN_INTERVAL = 1.0
+
+# URLs between in-place browser state clears, and the resident-memory
+# ceiling past which a full Chrome relaunch is worth its cost
+_SOFT_RESET_INTERVAL = 20
+_MAX_BROWSER_RSS = 1_500_000_000
+
+# Element-loop matchers and type sets, hoisted and compiled once; the
+# IGNORECASE flag replaces the per-element .lower() allocation
+_PRIVACY_RE = re.compile(r"privacy|terms|policy|agree|consent|gdpr", re.IGNORECASE)
+_CONFIRM_RE = re.compile(r"confirm|verify|repeat", re.IGNORECASE)
+_CHECKABLE_TYPES = frozenset(("checkbox", "radio"))
+_BUTTON_TYPES = frozenset(("submit", "button", "image"))
+
+# Fixed column budget for additional fields in the streamed CSV; anything
+# past it lands in one ExtraFieldsJSON column. A fixed header lets rows be
+# appended as they complete instead of rewriting the file per batch.
+MAX_ADDITIONAL_FIELDS = 30
+
+# Scrapers alive in this process, held weakly so normal garbage collection
+# still runs __del__; the exit hooks below sweep whatever remains
+_active_scrapers = weakref.WeakSet()
+
+
+def _cleanup_all_scrapers():
+    """Quit every live browser and reap leftover chrome processes; runs at
+    interpreter exit and on fatal signals so crashes don't leak Chrome"""
+    for scraper in list(_active_scrapers):
+        try:
+            scraper._force_cleanup()
+        except Exception:
+            pass
+
+
+def _install_exit_hooks():
+    """Register browser cleanup for normal exit and SIGTERM/SIGINT, chaining
+    to any handler that was already installed"""
+    atexit.register(_cleanup_all_scrapers)
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        previous = signal.getsignal(signum)
+
+        def handler(sig, frame, previous=previous):
+            _cleanup_all_scrapers()
+            if callable(previous):
+                # default_int_handler raises KeyboardInterrupt, so Ctrl+C
+                # still reaches run_scraper's interrupt path
+                previous(sig, frame)
+            else:
+                signal.signal(sig, signal.SIG_DFL)
+                os.kill(os.getpid(), sig)
+
+        try:
+            signal.signal(signum, handler)
+        except ValueError:
+            # Imported off the main thread; atexit alone will have to do
+            pass
+
+
+_install_exit_hooks()
+
+# Resource types the scraper never reads: blocking them drops most of the
+# bytes per page and speeds up DOMContentLoaded accordingly
+_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3", "*.avi",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+    "*facebook.net*", "*hotjar*"
+]
+
 class FormFieldScraper:
     def __init__(self, headless=True, timeout=30):
         """Initialize the scraper with browser options"""
         self.timeout = timeout
         self.headless = headless
+        self._urls_since_reset = 0
+        # Every chromedriver/chrome PID this instance ever launched; quit()
+        # is best-effort, so the exit hooks reap survivors from this set
+        self._browser_pids = set()
         self.setup_browser()
-        
+        _active_scrapers.add(self)
+
         # Initialize helpers
         self.field_detector = FieldDetector()
         
@@ -39,18 +141,66 @@ class FormFieldScraper:
         chrome_options.add_argument("--window-size=1920,1080")
         chrome_options.add_argument("--disable-extensions")
         chrome_options.add_argument("--disable-notifications")
+        # Belt and braces with the CDP block below: stop the renderer from
+        # decoding any image that slips through
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        # Switch off subsystems the scraper never uses: background traffic,
+        # sync/translate, metrics, phishing checks, component updates and
+        # the tab-backgrounding machinery that throttles headless work
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-translate")
+        chrome_options.add_argument("--metrics-recording-only")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_argument("--no-first-run")
+        chrome_options.add_argument("--disable-component-update")
+        chrome_options.add_argument("--disable-client-side-phishing-detection")
+        chrome_options.add_argument("--disable-ipc-flooding-protection")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+        # Use /tmp instead of the often-tiny /dev/shm for shared memory
+        chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.81 Safari/537.36")
         
         # Add options to avoid detection
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option("useAutomationExtension", False)
-        
+
+        # Return from driver.get at DOMContentLoaded instead of onload: the
+        # scraper never reads late-loading assets, and the WebDriverWait on
+        # <body> remains the real readiness gate
+        chrome_options.page_load_strategy = "eager"
+
         # Store options for recreation if needed
         self.chrome_options = chrome_options
-        
+
         # Create new browser
         self.driver = webdriver.Chrome(options=chrome_options)
+        # Abort hung pages instead of sitting in get()
+        self.driver.set_page_load_timeout(self.timeout)
+
+        # Record the chromedriver PID and its chrome children so the exit
+        # hooks can force-kill whatever outlives driver.quit()
+        try:
+            self._driver_pid = self.driver.service.process.pid
+            self._browser_pids.add(self._driver_pid)
+            if psutil is not None:
+                self._browser_pids.update(
+                    child.pid for child in
+                    psutil.Process(self._driver_pid).children(recursive=True))
+        except Exception as e:
+            logger.debug("Could not record browser PIDs: %s", e)
+
+        # Block images/fonts/media/analytics at the network layer; the
+        # form DOM is all the scraper ever inspects
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs",
+                                        {"urls": _BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.debug("Could not set up CDP request blocking: %s", e)
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
         # Initialize form analyzer with the new driver
@@ -64,92 +214,187 @@ class FormFieldScraper:
         except:
             pass
         self.setup_browser()
+        self._urls_since_reset = 0
+
+    def soft_reset_browser(self):
+        """Clear accumulated page state in place — cache, cookies, renderer
+        garbage — instead of paying for a full Chrome relaunch"""
+        try:
+            self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            self.driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+        except Exception as e:
+            logger.debug("Soft reset failed, falling back to full reset: %s", e)
+            self.reset_browser()
+
+    def _browser_rss(self):
+        """Resident memory of the browser process tree, or None if unknown"""
+        if psutil is None:
+            return None
+        try:
+            proc = psutil.Process(self.driver.service.process.pid)
+            return proc.memory_info().rss + sum(
+                child.memory_info().rss
+                for child in proc.children(recursive=True))
+        except Exception:
+            return None
+
+    def maybe_reset_browser(self):
+        """Periodic maintenance between URLs: soft-clear state, relaunching
+        Chrome only when its memory actually crossed the threshold"""
+        self._urls_since_reset += 1
+        if self._urls_since_reset < _SOFT_RESET_INTERVAL:
+            return
+        self._urls_since_reset = 0
+        rss = self._browser_rss()
+        if rss is not None and rss > _MAX_BROWSER_RSS:
+            logger.info("Browser RSS %.0fMB over threshold, full reset", rss / 1e6)
+            self.reset_browser()
+        else:
+            self.soft_reset_browser()
         
+    def _force_cleanup(self):
+        """Quit the browser, then force-kill any chrome/chromedriver
+        processes that survive within a 5-second grace period"""
+        try:
+            self.driver.quit()
+        except:
+            pass
+        deadline = time.monotonic() + 5
+        for pid in self._browser_pids:
+            try:
+                if psutil is not None:
+                    proc = psutil.Process(pid)
+                    # Guard against the PID having been recycled since launch
+                    if "chrom" not in proc.name().lower():
+                        continue
+                    try:
+                        proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+                    except psutil.TimeoutExpired:
+                        proc.kill()
+                else:
+                    os.kill(pid, signal.SIGKILL)
+            except Exception:
+                pass
+        self._browser_pids.clear()
+
     def __del__(self):
         """Clean up resources"""
         try:
-            self.driver.quit()
+            self._force_cleanup()
         except:
             pass
-    
-    def scrape_form_fields(self, url, retry_count=0, max_retries=2):
+
+    def _is_recoverable_error(self, error):
+        """Whether an error warrants a browser reset and retry, decided on
+        the exception type rather than substring scans of its message"""
+        if isinstance(error, (InvalidSessionIdException, NoSuchWindowException,
+                              SessionNotCreatedException)):
+            return True
+        return (isinstance(error, WebDriverException) and
+                "chrome not reachable" in (error.msg or ""))
+
+    def scrape_form_fields(self, url, max_retries=2):
         """Extract all form fields from a URL, with retry mechanism for session errors"""
-        logger.info(f"Processing: {url}")
-        result = {
-            'url': url,
-            'domain': urlparse(url).netloc,
-            'fields': {},
-            'additional_fields': [],
-            'has_captcha': False,
-            'has_additional_required_fields': False,
-            'error': None
-        }
-        
-        # Initialize all standard fields as empty
-        for field in self.field_detector.standard_fields:
-            result['fields'][field] = {'xpath': '', 'type': '', 'required': False, 'found': False}
-        
-        try:
-            self.driver.get(url)
+        logger.info("Processing: %s", url)
+
+        # Iterative retry loop: each attempt starts from a fresh result and
+        # recoverable failures reset the browser and go round again
+        result = None
+        for attempt in range(max_retries + 1):
+            result = {
+                'url': url,
+                'domain': _netloc(url),
+                'fields': {},
+                'additional_fields': [],
+                'has_captcha': False,
+                'has_additional_required_fields': False,
+                'error': None
+            }
+
+            # Initialize all standard fields as empty
+            for field in self.field_detector.standard_fields:
+                result['fields'][field] = {'xpath': '', 'type': '', 'required': False, 'found': False}
+
             try:
-                WebDriverWait(self.driver, self.timeout).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
+                self.driver.get(url)
+                try:
+                    # <body> exists almost immediately, so the default 500ms
+                    # poll quantum was nearly pure slack on every URL
+                    WebDriverWait(self.driver, self.timeout, poll_frequency=0.1).until(
+                        EC.presence_of_element_located((By.TAG_NAME, "body"))
+                    )
+
+                    self.form_analyzer.dismiss_cookie_banners()
+                    # Short delay to let the page settle
+                    time.sleep(1)
+                except TimeoutException:
+                    result['error'] = "Timeout loading page"
+                    return result
+
+                # Cheap pre-check: one selector count tells us whether the
+                # page has any form machinery at all, so form-less pages
+                # skip CAPTCHA detection and the whole element walk. Three
+                # short retries cover late dynamic rendering.
+                for _ in range(3):
+                    try:
+                        n = self.driver.execute_script(
+                            "return document.querySelectorAll("
+                            "'form,input,select,textarea').length;")
+                    except Exception:
+                        n = None
+                    if n is None or n > 0:
+                        break
+                    time.sleep(0.3)
+                else:
+                    result['error'] = "No form or input fields found"
+                    return result
+
+                # Check for CAPTCHA but continue processing anyway
+                try:
+                    has_captcha = self.form_analyzer.has_captcha()
+                    result['has_captcha'] = has_captcha
+                    if has_captcha:
+                        logger.info("CAPTCHA detected on %s - continuing to extract fields anyway", url)
+                except Exception as e:
+                    logger.warning("Error checking for CAPTCHA: %s", e)
+
+                # Get all form elements
+                main_container, all_form_elements = self.form_analyzer.find_form_and_elements()
+
+                if not main_container:
+                    result['error'] = "No form or input fields found"
+                    return result
+
+                if len(all_form_elements) < 2:
+                    result['error'] = "Not enough form elements found"
+                    return result
+
+                # Process all fields
+                self.process_form_elements(all_form_elements, result)
+
+                # Set flag if additional required fields were found
+                if result['additional_fields']:
+                    result['has_additional_required_fields'] = True
+
+                return result
 
-                self.form_analyzer.dismiss_cookie_banners()
-                # Short delay to let the page settle
-                time.sleep(1)
             except TimeoutException:
                 result['error'] = "Timeout loading page"
                 return result
-            
-            # Check for CAPTCHA but continue processing anyway
-            try:
-                has_captcha = self.form_analyzer.has_captcha() 
-                result['has_captcha'] = has_captcha
-                if has_captcha:
-                    logger.info(f"CAPTCHA detected on {url} - continuing to extract fields anyway")
             except Exception as e:
-                logger.warning(f"Error checking for CAPTCHA: {str(e)}")
-            
-            # Get all form elements
-            main_container, all_form_elements = self.form_analyzer.find_form_and_elements()
-            
-            if not main_container:
-                result['error'] = "No form or input fields found"
-                return result
-                
-            if len(all_form_elements) < 2:
-                result['error'] = "Not enough form elements found"
-                return result
-            
-            # Process all fields
-            self.process_form_elements(all_form_elements, result)
-            
-            # Set flag if additional required fields were found
-            if result['additional_fields']:
-                result['has_additional_required_fields'] = True
-            
-        except InvalidSessionIdException as e:
-            logger.warning(f"Invalid session ID encountered: {str(e)}")
-            if retry_count < max_retries:
-                logger.info(f"Retrying URL (attempt {retry_count+1}/{max_retries}): {url}")
-                self.reset_browser()
-                return self.scrape_form_fields(url, retry_count+1, max_retries)
-            else:
-                result['error'] = f"Invalid session ID after {max_retries} retries"
-        except TimeoutException:
-            result['error'] = "Timeout loading page"
-        except Exception as e:
-            result['error'] = str(e)
-            logger.error(f"Error processing {url}: {str(e)}")
-            # If the error looks like a browser issue, try to recover
-            if "session" in str(e).lower() or "browser" in str(e).lower():
-                if retry_count < max_retries:
-                    logger.info(f"Retrying URL (attempt {retry_count+1}/{max_retries}): {url}")
+                if self._is_recoverable_error(e) and attempt < max_retries:
+                    logger.warning("Recoverable browser error: %s", e)
+                    logger.info("Retrying URL (attempt %d/%d): %s", attempt + 1, max_retries, url)
                     self.reset_browser()
-                    return self.scrape_form_fields(url, retry_count+1, max_retries)
-        
+                    continue
+                if isinstance(e, InvalidSessionIdException):
+                    result['error'] = f"Invalid session ID after {max_retries} retries"
+                else:
+                    result['error'] = str(e)
+                    logger.error("Error processing %s: %s", url, e)
+                return result
+
         return result
 
     def process_form_elements(self, elements, result):
@@ -165,6 +410,10 @@ class FormFieldScraper:
         """
         # Tracking variables for smart detection
         processed_fields = set()
+
+        # Everything computed per element, keyed by its remote-ref id so
+        # later passes are dict lookups instead of recomputation
+        element_meta = {}
         
         # Enhanced candidate tracking
         privacy_candidates = []
@@ -176,46 +425,68 @@ class FormFieldScraper:
             if not elements:
                 logger.warning("No elements found to process")
                 return
-            
-            for element in elements:
+
+            # Snapshot type/visibility/required/xpath for every element in
+            # one round-trip; the loop below then only talks to the browser
+            # for field-name guessing
+            snapshot = self.form_analyzer.batch_element_snapshot(elements)
+            if snapshot is None:
+                snapshot = [None] * len(elements)
+
+            for element, meta in zip(elements, snapshot):
                 try:
-                    # Skip if element is invalid
-                    if not self.form_analyzer.is_element_visible(element):
-                        continue
-                    
-                    element_type = element.get_attribute("type") or element.tag_name
-                    
+                    if meta is not None:
+                        if not meta['visible']:
+                            continue
+                        element_type = meta['type']
+                        is_required = meta['required']
+                        xpath = meta['xpath']
+                    else:
+                        # Per-element fallback when the snapshot failed
+                        if not self.form_analyzer.is_element_visible(element):
+                            continue
+                        element_type = element.get_attribute("type") or element.tag_name
+                        is_required = self.form_analyzer.is_element_required(element)
+                        xpath = None
+
                     # Skip hidden inputs
                     if element_type == 'hidden':
                         continue
-                    
+
                     # Special handling for submit buttons
-                    if element_type in ['submit', 'button', 'image']:
+                    if element_type in _BUTTON_TYPES:
                         self.form_analyzer.process_button(element, result)
                         continue
-                    
+
                     guessed_name = self.field_detector.guess_field_name(element, self.driver)
                     mapped_field = self.field_detector.map_to_standard_field(guessed_name, element_type)
-                    
-                    # Detect required status
-                    is_required = self.form_analyzer.is_element_required(element)
-                    
+
+                    if xpath is None:
+                        xpath = self.form_analyzer.get_xpath(element)
+
+                    element_meta[element._id] = {
+                        'type': element_type,
+                        'required': is_required,
+                        'xpath': xpath,
+                        'guessed_name': guessed_name,
+                        'mapped_field': mapped_field
+                    }
+
                     # Collect privacy policy candidates
-                    if element_type in ['checkbox', 'radio']:
-                        privacy_terms = ["privacy", "terms", "policy", "agree", "consent", "gdpr"]
-                        if any(term in guessed_name.lower() for term in privacy_terms):
-                            privacy_candidates.append((element, guessed_name))
-                    
+                    if element_type in _CHECKABLE_TYPES:
+                        if _PRIVACY_RE.search(guessed_name):
+                            privacy_candidates.append((element, xpath, element_type))
+
                     # Collect email confirmation candidates
-                    if (mapped_field == 'ConfirmEmail' or 
-                        (element_type == 'email' and 
-                        any(term in guessed_name.lower() for term in ['confirm', 'verify', 'repeat']))):
-                        email_confirmation_candidates.append((element, guessed_name))
-                    
+                    if (mapped_field == 'ConfirmEmail' or
+                        (element_type == 'email' and
+                        _CONFIRM_RE.search(guessed_name))):
+                        email_confirmation_candidates.append((element, xpath, element_type))
+
                     # Map primary fields
                     if mapped_field and mapped_field not in processed_fields:
                         result['fields'][mapped_field] = {
-                            'xpath': self.form_analyzer.get_xpath(element),
+                            'xpath': xpath,
                             'type': element_type,
                             'required': is_required,
                             'found': True
@@ -225,39 +496,39 @@ class FormFieldScraper:
                         # Capture required additional fields
                         result['additional_fields'].append({
                             'field_name': guessed_name,
-                            'xpath': self.form_analyzer.get_xpath(element),
+                            'xpath': xpath,
                             'element_type': element_type,
                             'required': True
                         })
-                    
+
                     # Capture non-required additional fields
                     elif not mapped_field:
                         result['additional_fields'].append({
                             'field_name': guessed_name,
-                            'xpath': self.form_analyzer.get_xpath(element),
+                            'xpath': xpath,
                             'element_type': element_type,
                             'required': False
                         })
-                
+
                 except Exception as e:
-                    logger.debug(f"Individual element processing error: {e}")
-            
+                    logger.debug("Individual element processing error: %s", e)
+
             # Add privacy field if not found
             if privacy_candidates and not result['fields']['Privacy']['found']:
-                best_privacy = privacy_candidates[0][0]
+                _, xpath, element_type = privacy_candidates[0]
                 result['fields']['Privacy'] = {
-                    'xpath': self.form_analyzer.get_xpath(best_privacy),
-                    'type': best_privacy.get_attribute("type"),
+                    'xpath': xpath,
+                    'type': element_type,
                     'required': False,
                     'found': True
                 }
-            
+
             # Add email confirmation field if not found
             if email_confirmation_candidates and not result['fields']['ConfirmEmail']['found']:
-                best_confirm = email_confirmation_candidates[0][0]
+                _, xpath, element_type = email_confirmation_candidates[0]
                 result['fields']['ConfirmEmail'] = {
-                    'xpath': self.form_analyzer.get_xpath(best_confirm),
-                    'type': best_confirm.get_attribute("type"),
+                    'xpath': xpath,
+                    'type': element_type,
                     'required': False,
                     'found': True
                 }
@@ -278,10 +549,10 @@ class FormFieldScraper:
                         pass
             
             # Additional pass to find missing priority fields
-            self.find_missing_fields(elements, result)
+            self.find_missing_fields(elements, result, element_meta)
         
         except Exception as e:
-            logger.error(f"Comprehensive field processing error: {e}")
+            logger.error("Comprehensive field processing error: %s", e)
             # Ensure minimal result structure if processing fails
             if 'Submit' not in result['fields']:
                 result['fields']['Submit'] = {
@@ -291,119 +562,253 @@ class FormFieldScraper:
                     'found': False
                 } 
 
-    def find_missing_fields(self, elements, result):
+    def find_missing_fields(self, elements, result, element_meta=None):
         """Find any important fields that weren't identified in the first pass"""
+        if element_meta is None:
+            element_meta = {}
+
+        def field_entry(element):
+            # Reuse what the first pass already computed for this element;
+            # only cache misses talk to the browser again
+            meta = element_meta.get(element._id)
+            if meta is not None:
+                return {
+                    'xpath': meta['xpath'],
+                    'type': meta['type'],
+                    'required': meta['required'],
+                    'found': True
+                }
+            return {
+                'xpath': self.form_analyzer.get_xpath(element),
+                'type': element.get_attribute("type") or element.tag_name,
+                'required': self.form_analyzer.is_element_required(element),
+                'found': True
+            }
+
         # Look for privacy checkbox
         if not result['fields']['Privacy']['found']:
             privacy_element = self.form_analyzer.find_privacy_checkbox(elements)
             if privacy_element:
                 try:
-                    element_type = privacy_element.get_attribute("type") or privacy_element.tag_name
-                    result['fields']['Privacy'] = {
-                        'xpath': self.form_analyzer.get_xpath(privacy_element),
-                        'type': element_type,
-                        'required': self.form_analyzer.is_element_required(privacy_element),
-                        'found': True
-                    }
+                    result['fields']['Privacy'] = field_entry(privacy_element)
+                except:
+                    pass
+
+        # Look for priority fields: one shared scan over the elements for
+        # every missing field, and nothing at all when none are missing
+        missing = {field_name for field_name in self.field_detector.priority_fields
+                   if not result['fields'][field_name]['found']}
+        if missing:
+            candidates = self.form_analyzer.find_best_candidates(
+                elements, missing, self.field_detector)
+            for field_name, candidate in candidates.items():
+                try:
+                    result['fields'][field_name] = field_entry(candidate)
                 except:
                     pass
-        
-        # Look for priority fields
-        for field_name in self.field_detector.priority_fields:
-            if not result['fields'][field_name]['found']:
-                candidate = self.form_analyzer.find_best_candidate_for_field(
-                    elements, field_name, self.field_detector)
-                if candidate:
-                    try:
-                        element_type = candidate.get_attribute("type") or candidate.tag_name
-                        result['fields'][field_name] = {
-                            'xpath': self.form_analyzer.get_xpath(candidate),
-                            'type': element_type,
-                            'required': self.form_analyzer.is_element_required(candidate),
-                            'found': True
-                        }
-                    except:
-                        pass
         
         # Special case for email fields
         if not result['fields']['Email']['found'] and result['fields']['ConfirmEmail']['found']:
             result['fields']['Email'] = result['fields']['ConfirmEmail']
             result['fields']['ConfirmEmail'] = {'xpath': '', 'type': '', 'required': False, 'found': False}
     
-    def process_url_list(self, url_list, output_file="form_fields.csv", batch_size=20):
-        """Process a list of URLs and save results to CSV with checkpointing and batching"""
-        all_results = []
-        completed_urls = set()
-        
-        # Check for existing checkpoint file
-        checkpoint_file = f"{output_file}.checkpoint"
-        if os.path.exists(checkpoint_file):
+    def process_url_list(self, url_list, output_file="form_fields.csv", batch_size=20,
+                         max_workers=4):
+        """Process a list of URLs across a pool of browser workers and save
+        results to CSV with an SQLite store and per-domain rate limiting"""
+        # SQLite results store: crash-safe, restartable, and it keeps the
+        # full result for every URL rather than just the fact it was seen
+        db_file = f"{output_file}.db"
+        conn = sqlite3.connect(db_file, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS results "
+                     "(url TEXT PRIMARY KEY, json TEXT, ts REAL)")
+        completed_urls = {row[0] for row in conn.execute("SELECT url FROM results")}
+
+        # Honour checkpoints from the old plain-text format too
+        legacy_checkpoint = f"{output_file}.checkpoint"
+        if os.path.exists(legacy_checkpoint):
             try:
-                with open(checkpoint_file, 'r') as f:
-                    for line in f:
-                        completed_urls.add(line.strip())
-                logger.info(f"Loaded {len(completed_urls)} completed URLs from checkpoint")
+                with open(legacy_checkpoint, 'r') as f:
+                    completed_urls.update(line.strip() for line in f)
             except Exception as e:
-                logger.warning(f"Error loading checkpoint file: {str(e)}")
-        
+                logger.warning("Error loading legacy checkpoint file: %s", e)
+        if completed_urls:
+            logger.info("Loaded %d completed URLs from previous runs", len(completed_urls))
+
         # Filter out already completed URLs
         urls_to_process = [url for url in url_list if url not in completed_urls]
-        logger.info(f"Processing {len(urls_to_process)} URLs out of {len(url_list)} total")
-        
-        # Process URLs in batches
-        for i in range(0, len(urls_to_process), batch_size):
-            batch_urls = urls_to_process[i:i+batch_size]
-            logger.info(f"Processing batch {i//batch_size + 1}/{(len(urls_to_process)-1)//batch_size + 1} ({len(batch_urls)} URLs)")
-            
-            batch_results = []
-            for j, url in enumerate(batch_urls):
+        logger.info("Processing %d URLs out of %d total", len(urls_to_process), len(url_list))
+
+        if not urls_to_process:
+            conn.close()
+            return []
+
+        # One browser per worker: this instance serves the first worker and
+        # the extras are created up front, handed out through a queue
+        worker_count = max(1, min(max_workers, len(urls_to_process)))
+        extra_workers = [FormFieldScraper(headless=self.headless, timeout=self.timeout)
+                         for _ in range(worker_count - 1)]
+        scrapers = Queue()
+        scrapers.put(self)
+        for scraper in extra_workers:
+            scrapers.put(scraper)
+
+        db_lock = threading.Lock()
+        rate_lock = threading.Lock()
+        last_hit = defaultdict(float)
+
+        def process_one(url):
+            # Per-domain rate limit: reserve the next slot for this domain
+            # under the lock, sleep outside it; unrelated domains never
+            # block each other
+            domain = _netloc(url)
+            with rate_lock:
+                now = time.monotonic()
+                start = max(now, last_hit[domain] + _MIN_DOMAIN_INTERVAL)
+                last_hit[domain] = start
+            if start > now:
+                time.sleep(start - now)
+
+            scraper = scrapers.get()
+            try:
+                result = scraper.scrape_form_fields(url)
+                # Browser maintenance is kept outside the result path: a
+                # failed relaunch must not turn a good scrape into an
+                # error row
                 try:
-                    logger.info(f"Processing URL {i+j+1}/{len(urls_to_process)}: {url}")
-                    result = self.scrape_form_fields(url)
-                    batch_results.append(result)
-                    
-                    # Update checkpoint after each successful URL
-                    try:
-                        with open(checkpoint_file, 'a') as f:
-                            f.write(f"{url}\n")
-                    except Exception as e:
-                        logger.warning(f"Error updating checkpoint: {str(e)}")
-                    
-                    # Small delay to be nice to servers
-                    time.sleep(1)
+                    scraper.maybe_reset_browser()
                 except Exception as e:
-                    logger.error(f"Unrecoverable error processing {url}: {str(e)}")
-                    
-                    # Add error entry to results
-                    error_result = {
-                        'url': url,
-                        'domain': urlparse(url).netloc if url.startswith('http') else '',
-                        'fields': {field: {'xpath': '', 'type': '', 'required': False, 'found': False} 
-                                  for field in self.field_detector.standard_fields},
-                        'additional_fields': [],
-                        'has_captcha': False,
-                        'has_additional_required_fields': False,
-                        'error': str(e)
-                    }
-                    batch_results.append(error_result)
-            
-            # Add batch results to all results
-            all_results.extend(batch_results)
-            
-            # Save interim results after each batch
-            self.save_results_to_csv(all_results, output_file)
-            
-            # Reset browser between batches to prevent memory issues
-            if i + batch_size < len(urls_to_process):
-                logger.info("Resetting browser between batches")
-                self.reset_browser()
-        
-        # Save final results
-        self.save_results_to_csv(all_results, output_file)
-        logger.info(f"All results saved to {output_file}")
-        
+                    logger.warning("Browser maintenance failed after %s: %s", url, e)
+            except Exception as e:
+                logger.error("Unrecoverable error processing %s: %s", url, e)
+                result = {
+                    'url': url,
+                    'domain': _netloc(url) if url.startswith('http') else '',
+                    'fields': {field: {'xpath': '', 'type': '', 'required': False, 'found': False}
+                              for field in self.field_detector.standard_fields},
+                    'additional_fields': [],
+                    'has_captcha': False,
+                    'has_additional_required_fields': False,
+                    'error': str(e)
+                }
+            finally:
+                scrapers.put(scraper)
+
+            # Record the full result after each URL; WAL keeps per-URL
+            # commits cheap and the write atomic
+            with db_lock:
+                try:
+                    conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                                 (url, json.dumps(result), time.time()))
+                    conn.commit()
+                except Exception as e:
+                    logger.warning("Error recording result for %s: %s", url, e)
+            return result
+
+        # Rows are streamed to the CSV as they complete, so batch K costs
+        # only its own rows instead of rewriting everything so far; the
+        # returned list is still ordered by submission index
+        csvfile, writer = self._open_results_csv(output_file)
+        results_by_index = {}
+        try:
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                futures = {executor.submit(process_one, url): i
+                           for i, url in enumerate(urls_to_process)}
+                done = 0
+                for future in as_completed(futures):
+                    result = future.result()
+                    results_by_index[futures[future]] = result
+                    writer.writerow(self._row_from_result(result))
+                    done += 1
+                    logger.info("Completed %d/%d URLs", done, len(urls_to_process))
+                    # Flush streamed rows once per batch
+                    if done % batch_size == 0:
+                        csvfile.flush()
+        finally:
+            try:
+                csvfile.close()
+            except Exception as e:
+                logger.warning("Error closing results CSV: %s", e)
+            for scraper in extra_workers:
+                try:
+                    scraper.driver.quit()
+                except:
+                    pass
+
+        # Export the complete store — including earlier runs — so the final
+        # CSV covers every URL ever processed for this output file
+        try:
+            stored = [json.loads(row[0]) for row in
+                      conn.execute("SELECT json FROM results ORDER BY ts")]
+            self.save_results_to_csv(stored, output_file)
+        except Exception as e:
+            logger.warning("Error exporting results from store: %s", e)
+        conn.close()
+
+        all_results = [results_by_index[i] for i in sorted(results_by_index)]
+        logger.info("All results saved to %s", output_file)
+
         return all_results
         
+    def _open_results_csv(self, output_file):
+        """Open the output CSV once with the fixed streaming header"""
+        fieldnames = ['url', 'domain']
+        for field in self.field_detector.standard_fields:
+            fieldnames.append(f"{field}Type")
+            fieldnames.append(f"{field}XPath")
+        fieldnames.extend(['HasAdditionalFields', 'HasCaptcha', 'error'])
+        for i in range(1, MAX_ADDITIONAL_FIELDS + 1):
+            fieldnames.append(f"AdditionalField{i}Name")
+            fieldnames.append(f"AdditionalField{i}Type")
+            fieldnames.append(f"AdditionalField{i}XPath")
+            fieldnames.append(f"AdditionalField{i}Required")
+        fieldnames.append('ExtraFieldsJSON')
+
+        # Name→index map computed once; rows are then plain positional
+        # lists instead of per-row dicts that DictWriter re-hashes
+        self._csv_index = {name: i for i, name in enumerate(fieldnames)}
+        self._csv_width = len(fieldnames)
+
+        csvfile = open(output_file, 'w', newline='', encoding='utf-8')
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        return csvfile, writer
+
+    def _row_from_result(self, result):
+        """Flatten one result dict into a positional CSV row for the
+        streaming writer"""
+        idx = self._csv_index
+        row = [''] * self._csv_width
+        row[idx['url']] = result['url']
+        row[idx['domain']] = result['domain']
+        row[idx['HasAdditionalFields']] = len(result.get('additional_fields', [])) > 0
+        row[idx['HasCaptcha']] = result.get('has_captcha', False)
+        row[idx['error']] = result.get('error', '')
+
+        for field_name, field_data in result['fields'].items():
+            if field_data.get('found', False):
+                row[idx[f"{field_name}XPath"]] = field_data.get('xpath', '')
+                row[idx[f"{field_name}Type"]] = field_data.get('type', '')
+
+        additional_fields = result.get('additional_fields', [])
+        # The four AdditionalFieldN columns are contiguous per field, so
+        # one stride from the first replaces four lookups per field
+        base = idx['AdditionalField1Name']
+        for i, field in enumerate(additional_fields[:MAX_ADDITIONAL_FIELDS]):
+            offset = base + 4 * i
+            row[offset] = field.get('field_name', '')
+            row[offset + 1] = field.get('element_type', '')
+            row[offset + 2] = field.get('xpath', '')
+            row[offset + 3] = field.get('required', False)
+
+        overflow = additional_fields[MAX_ADDITIONAL_FIELDS:]
+        if overflow:
+            row[idx['ExtraFieldsJSON']] = json.dumps(overflow)
+
+        return row
+
     def save_results_to_csv(self, results, output_file):
         """Save the scraped results to a CSV file"""
         with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
@@ -424,10 +829,8 @@ class FormFieldScraper:
             ])
             
             # Count maximum number of additional fields in any result
-            max_additional = 0
-            for result in results:
-                if len(result.get('additional_fields', [])) > max_additional:
-                    max_additional = len(result.get('additional_fields', []))
+            max_additional = max((len(result.get('additional_fields', ()))
+                                  for result in results), default=0)
             
             # Add columns for each potential additional field
             for i in range(1, max_additional + 1):
@@ -436,30 +839,37 @@ class FormFieldScraper:
                 fieldnames.append(f"AdditionalField{i}XPath")
                 fieldnames.append(f"AdditionalField{i}Required")
             
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
+            # Positional rows against a name→index map computed once; with
+            # 100+ columns, DictWriter's per-row dict hashing is measurable
+            idx = {name: i for i, name in enumerate(fieldnames)}
+            width = len(fieldnames)
+
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+
             for result in results:
-                row = {
-                    'url': result['url'],
-                    'domain': result['domain'],
-                    'HasAdditionalFields': len(result.get('additional_fields', [])) > 0,
-                    'HasCaptcha': result.get('has_captcha', False),
-                    'error': result.get('error', '')
-                }
-                
+                row = [''] * width
+                row[idx['url']] = result['url']
+                row[idx['domain']] = result['domain']
+                row[idx['HasAdditionalFields']] = len(result.get('additional_fields', [])) > 0
+                row[idx['HasCaptcha']] = result.get('has_captcha', False)
+                row[idx['error']] = result.get('error', '')
+
                 # Add standard fields
                 for field_name, field_data in result['fields'].items():
-                    row[f"{field_name}XPath"] = field_data.get('xpath', '') if field_data.get('found', False) else ""
-                    row[f"{field_name}Type"] = field_data.get('type', '') if field_data.get('found', False) else ""
-                
-                # Add all additional fields with numbering
-                additional_fields = result.get('additional_fields', [])
-                for i, field in enumerate(additional_fields, 1):
-                    if i <= max_additional:  # Only add up to the max count we determined
-                        row[f"AdditionalField{i}Name"] = field.get('field_name', '')
-                        row[f"AdditionalField{i}Type"] = field.get('element_type', '')
-                        row[f"AdditionalField{i}XPath"] = field.get('xpath', '')
-                        row[f"AdditionalField{i}Required"] = field.get('required', False)
-                
+                    if field_data.get('found', False):
+                        row[idx[f"{field_name}XPath"]] = field_data.get('xpath', '')
+                        row[idx[f"{field_name}Type"]] = field_data.get('type', '')
+
+                # Add all additional fields with numbering; the four columns
+                # per field are contiguous, so stride from the first
+                if max_additional:
+                    base = idx['AdditionalField1Name']
+                    for i, field in enumerate(result.get('additional_fields', [])[:max_additional]):
+                        offset = base + 4 * i
+                        row[offset] = field.get('field_name', '')
+                        row[offset + 1] = field.get('element_type', '')
+                        row[offset + 2] = field.get('xpath', '')
+                        row[offset + 3] = field.get('required', False)
+
                 writer.writerow(row)
\ No newline at end of file
@@ -1,6 +1,7 @@
 # run_scraper.py
 import logging
 import sys
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 from form_scraper import FormFieldScraper
 
 # Configure logging
@@ -10,8 +11,31 @@ logging.basicConfig(level=logging.INFO,
                               logging.StreamHandler()])
 logger = logging.getLogger(__name__)
 
+# Query parameters that only carry ad/campaign tracking state; stripping
+# them lets otherwise-identical URLs collapse to one entry
+_TRACKING_PARAMS = frozenset((
+    "gclid", "fbclid", "msclkid", "dclid", "igshid",
+    "mc_cid", "mc_eid", "ref", "referrer",
+))
+
+
+def _canonicalize_url(url):
+    """Normalize a URL so trivial variants dedupe: lowercase host, drop
+    www., strip the fragment, tracking params and any trailing slash"""
+    parts = urlparse(url)
+    query = urlencode([(k, v) for k, v in
+                       parse_qsl(parts.query, keep_blank_values=True)
+                       if k not in _TRACKING_PARAMS and not k.startswith("utm_")])
+    return urlunparse(parts._replace(
+        netloc=parts.netloc.lower().removeprefix("www."),
+        path=parts.path.rstrip("/"),
+        query=query,
+        fragment=""))
+
+
 def load_urls_from_file(file_path):
-    """Load URLs from a text file (one URL per line)"""
+    """Load URLs from a text file (one URL per line), canonicalized and
+    deduplicated in first-seen order"""
     urls = []
     try:
         with open(file_path, 'r') as f:
@@ -19,8 +43,13 @@ def load_urls_from_file(file_path):
                 url = line.strip()
                 if url and not url.startswith('#'):  # Skip empty lines and comments
                     urls.append(url)
-        logger.info(f"Loaded {len(urls)} URLs from {file_path}")
-        return urls
+        # Crawled lists commonly repeat the same page under www./fragment/
+        # tracking-param variants; each duplicate is a full scrape wasted
+        unique_urls = list(dict.fromkeys(_canonicalize_url(url) for url in urls))
+        if len(unique_urls) < len(urls):
+            logger.info(f"Dropped {len(urls) - len(unique_urls)} duplicate URLs after canonicalization")
+        logger.info(f"Loaded {len(unique_urls)} URLs from {file_path}")
+        return unique_urls
     except Exception as e:
         logger.error(f"Error loading URLs from file: {str(e)}")
         return []
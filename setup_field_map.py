@@ -0,0 +1,6 @@
+# Builds the optional field_map Cython extension:
+#     python setup_field_map.py build_ext --inplace
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(ext_modules=cythonize("field_map.pyx"))